@@ -0,0 +1,80 @@
+import json
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor, CursorPagination
+
+
+class KeysetCursorPagination(CursorPagination):
+    """
+    Cursor pagination on a composite (field, id) keyset.
+    The cursor stores the field value and id of the last row, and the next page filters on
+    (field, id) past that pair, so ties and edited rows never need an OFFSET.
+    Orderings are (field, id) pairs with the same direction on a non-nullable field.
+    """
+    ordering_choices = {}
+
+    def get_ordering(self, request, queryset, view):
+        """
+        Returns the supported ordering requested via the 'ordering' query parameter.
+        """
+        return self.ordering_choices.get(request.query_params.get('ordering'), self.ordering)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.field_name = self.ordering[0].lstrip('-')
+        self.field = queryset.model._meta.get_field(self.field_name)
+        self.cursor = self.decode_cursor(request)
+
+        reverse = self.cursor is not None and self.cursor.reverse
+        ordering = [self._flip(name) for name in self.ordering] if reverse else self.ordering
+        queryset = queryset.order_by(*ordering)
+        if self.cursor is not None:
+            queryset = queryset.filter(self._after(self._decode_position(self.cursor.position), ordering))
+
+        results = list(queryset[:self.page_size + 1])
+        self.page = results[:self.page_size]
+        has_more = len(results) > self.page_size
+        if reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, self.cursor is not None
+        return self.page
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(Cursor(offset=0, reverse=False, position=self._encode_position(self.page[-1])))
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(Cursor(offset=0, reverse=True, position=self._encode_position(self.page[0])))
+
+    def _flip(self, name):
+        return name[1:] if name.startswith('-') else f'-{name}'
+
+    def _after(self, position, ordering):
+        """
+        Returns the filter for rows past position in the given ordering.
+        """
+        value, pk = position
+        lookup = 'lt' if ordering[0].startswith('-') else 'gt'
+        return Q(**{f'{self.field_name}__{lookup}': value}) | Q(**{self.field_name: value, f'pk__{lookup}': pk})
+
+    def _encode_position(self, instance):
+        return json.dumps([self.field.value_to_string(instance), instance.pk])
+
+    def _decode_position(self, position):
+        try:
+            value, pk = json.loads(position)
+            return self.field.to_python(value), int(pk)
+        except (TypeError, ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
@@ -48,6 +48,8 @@ INSTALLED_APPS = [
     'offers_app',
     'orders_app',
     'reviews_app',
+    'media_app',
+    'idempotency_app',
 ]
 
 MIDDLEWARE = [
@@ -151,10 +153,49 @@ REST_FRAMEWORK = {
     'MAX_PAGE_SIZE': 6,
 }
 
+# The offer response cache, its version keys and hit/miss counters must be shared by all workers.
+# Set REDIS_URL to use Redis; otherwise the database cache table (manage.py createcachetable) is used.
+REDIS_URL = os.environ.get('REDIS_URL')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'django_cache',
+            'OPTIONS': {'MAX_ENTRIES': 10000},
+        }
+    }
+
+OFFER_CACHE_TIMEOUT = 300
+OFFER_BULK_IMPORT_MAX_ROWS = 1000
+OFFER_CARDS_ENABLED = True
+OFFER_FEATURES_MAX_LIMIT = 100
+BATCH_FETCH_MAX_IDS = 50
+ORDER_BATCH_MAX_SIZE = 20
+ORDER_EXPORT_CHUNK_SIZE = 2000
+ORDER_ROLLUP_DEFAULT_DAYS = 30
+ORDER_ARCHIVE_AFTER_DAYS = 365
+IDEMPOTENCY_KEY_TTL = 60 * 60 * 24
+# Lease of an in-flight key; keep it above the worker request timeout so a running request is never taken over.
+IDEMPOTENCY_IN_FLIGHT_TIMEOUT = 60
+IDEMPOTENCY_WAIT_TIMEOUT = 10
+IDEMPOTENCY_POLL_INTERVAL = 0.1
+OFFER_FACET_PRICE_BUCKETS = [50, 100, 250, 500, 1000]
+OFFER_FACET_DELIVERY_BUCKETS = [1, 3, 7, 14, 30]
+
 CORS_ALLOW_ALL_ORIGINS = True
 CORS_ALLOW_CREDENTIALS = True
 
 MEDIA_ROOT = BASE_DIR / 'media'
 MEDIA_URL = '/media/'
 
+# Larger uploads are streamed to a temporary file instead of being held in memory.
+FILE_UPLOAD_MAX_MEMORY_SIZE = 512 * 1024
+
 AUTH_USER_MODEL = 'auth_app.CustomUser'
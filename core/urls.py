@@ -18,6 +18,7 @@ from django.db.models import Avg, Count
 from auth_app.models import CustomUser
 from offers_app.models import Offer
 from reviews_app.models import Review
+from media_app.views import serve_blob
 
 
 def base_info(request):
@@ -51,5 +52,8 @@ urlpatterns = [
     path('api/', include('offers_app.api.urls')),
     path('api/', include('orders_app.api.urls')),
     path('api/', include('reviews_app.api.urls')),
-] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+]
+if settings.DEBUG:
+    urlpatterns.append(path(f"{settings.MEDIA_URL.lstrip('/')}blobs/<path:path>", serve_blob, name='media-blob'))
+urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
 urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
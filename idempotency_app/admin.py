@@ -0,0 +1,11 @@
+from django.contrib import admin
+from .models import IdempotencyRecord
+
+
+@admin.register(IdempotencyRecord)
+class IdempotencyRecordAdmin(admin.ModelAdmin):
+    list_display = ['key', 'scope', 'user', 'state', 'response_status', 'created_at', 'expires_at']
+    list_filter = ['scope', 'state']
+    search_fields = ['key', 'user__username']
+    readonly_fields = ['user', 'scope', 'key', 'fingerprint', 'state', 'response_status', 'response_body',
+                       'created_at', 'expires_at']
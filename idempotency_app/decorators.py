@@ -0,0 +1,99 @@
+import functools
+import hashlib
+import json
+import time
+from datetime import timedelta
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.response import Response
+from .models import IdempotencyRecord
+
+IDEMPOTENCY_HEADER = 'Idempotency-Key'
+REPLAYED_HEADER = 'Idempotent-Replayed'
+
+
+def _fingerprint(request):
+    payload = json.dumps(request.data, sort_keys=True, default=str)
+    return hashlib.sha256(f'{request.method} {request.path}\n{payload}'.encode()).hexdigest()
+
+
+def _claim(request, scope, key, fingerprint):
+    """
+    Inserts an in-flight record for the key and returns it, or returns None if the key is taken.
+    Records past their expiry are replaced, including in-flight records abandoned by a crashed worker.
+    """
+    records = IdempotencyRecord.objects.filter(user=request.user, scope=scope, key=key)
+    records.filter(expires_at__lte=timezone.now()).delete()
+    try:
+        with transaction.atomic():
+            return IdempotencyRecord.objects.create(
+                user=request.user,
+                scope=scope,
+                key=key,
+                fingerprint=fingerprint,
+                expires_at=timezone.now() + timedelta(seconds=settings.IDEMPOTENCY_IN_FLIGHT_TIMEOUT)
+            )
+    except IntegrityError:
+        return None
+
+
+def _replay(record):
+    response = Response(record.response_body, status=record.response_status)
+    response[REPLAYED_HEADER] = 'true'
+    return response
+
+
+def idempotent(scope):
+    """
+    Makes a view method honour the Idempotency-Key header.
+    The first request with a key runs the view and stores its response for IDEMPOTENCY_KEY_TTL seconds.
+    Retries replay the stored response. Duplicates arriving while the first request still runs wait
+    for it up to IDEMPOTENCY_WAIT_TIMEOUT seconds and then get its response, or 409 if it is still running.
+    In-flight keys are leased for IDEMPOTENCY_IN_FLIGHT_TIMEOUT seconds, so a key left by a crashed worker is freed.
+    Responses with a 5xx status or an exception release the key so the client can retry.
+    """
+    def decorator(view_method):
+        @functools.wraps(view_method)
+        def wrapper(self, request, *args, **kwargs):
+            key = request.headers.get(IDEMPOTENCY_HEADER)
+            if not key or not request.user.is_authenticated:
+                return view_method(self, request, *args, **kwargs)
+            if len(key) > 255:
+                return Response({'error': f'{IDEMPOTENCY_HEADER} darf höchstens 255 Zeichen lang sein.'}, status=status.HTTP_400_BAD_REQUEST)
+
+            fingerprint = _fingerprint(request)
+            deadline = time.monotonic() + settings.IDEMPOTENCY_WAIT_TIMEOUT
+            while True:
+                record = _claim(request, scope, key, fingerprint)
+                if record is not None:
+                    break
+                existing = IdempotencyRecord.objects.filter(user=request.user, scope=scope, key=key).first()
+                if existing is None:
+                    continue
+                if existing.fingerprint != fingerprint:
+                    return Response({'error': f'{IDEMPOTENCY_HEADER} wurde bereits für eine andere Anfrage verwendet.'}, status=status.HTTP_422_UNPROCESSABLE_ENTITY)
+                if existing.state == 'completed':
+                    return _replay(existing)
+                if time.monotonic() >= deadline:
+                    return Response({'error': 'Eine Anfrage mit diesem Idempotency-Key wird noch verarbeitet.'}, status=status.HTTP_409_CONFLICT)
+                time.sleep(settings.IDEMPOTENCY_POLL_INTERVAL)
+
+            try:
+                response = view_method(self, request, *args, **kwargs)
+            except Exception:
+                record.delete()
+                raise
+            if response.status_code >= 500:
+                record.delete()
+                return response
+
+            record.state = 'completed'
+            record.response_status = response.status_code
+            record.response_body = response.data
+            record.expires_at = timezone.now() + timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL)
+            record.save(update_fields=['state', 'response_status', 'response_body', 'expires_at'])
+            return response
+        return wrapper
+    return decorator
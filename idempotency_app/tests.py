@@ -0,0 +1,92 @@
+from datetime import timedelta
+from unittest import mock
+from django.conf import settings
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, force_authenticate
+from rest_framework.views import APIView
+from auth_app.models import CustomUser
+from .decorators import _fingerprint, idempotent
+from .models import IdempotencyRecord
+
+
+class CountingView(APIView):
+    calls = 0
+
+    @idempotent('tests.create')
+    def post(self, request):
+        CountingView.calls += 1
+        return Response({'created': CountingView.calls}, status=201)
+
+
+class IdempotentDecoratorTests(TestCase):
+    """
+    Ensures duplicate requests never run the view twice for the same Idempotency-Key.
+    """
+
+    def setUp(self):
+        CountingView.calls = 0
+        self.user = CustomUser.objects.create_user(
+            username='customer', email='customer@example.com', password='password', type='customer'
+        )
+        self.factory = APIRequestFactory()
+
+    def post(self, data, key='key-1'):
+        request = self.factory.post('/orders/', data, format='json', HTTP_IDEMPOTENCY_KEY=key)
+        force_authenticate(request, self.user)
+        return CountingView.as_view()(request)
+
+    def test_retry_replays_the_stored_response(self):
+        self.assertEqual(self.post({'offer': 1}).status_code, 201)
+        response = self.post({'offer': 1})
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response['Idempotent-Replayed'], 'true')
+        self.assertEqual(CountingView.calls, 1)
+
+    def test_reusing_a_key_for_another_payload_is_rejected(self):
+        self.post({'offer': 1})
+        self.assertEqual(self.post({'offer': 2}).status_code, 422)
+        self.assertEqual(CountingView.calls, 1)
+
+    def in_flight_record(self, data, expires_in=None):
+        request = self.factory.post('/orders/', data, format='json')
+        force_authenticate(request, self.user)
+        if expires_in is None:
+            expires_in = settings.IDEMPOTENCY_IN_FLIGHT_TIMEOUT
+        return IdempotencyRecord.objects.create(
+            user=self.user, scope='tests.create', key='key-1',
+            fingerprint=_fingerprint(CountingView().initialize_request(request)),
+            expires_at=timezone.now() + timedelta(seconds=expires_in)
+        )
+
+    def test_concurrent_duplicate_waits_for_the_first_response(self):
+        record = self.in_flight_record({'offer': 1})
+
+        def finish_first_request(seconds):
+            record.state = 'completed'
+            record.response_status = 201
+            record.response_body = {'created': 1}
+            record.save()
+
+        with mock.patch('idempotency_app.decorators.time.sleep', side_effect=finish_first_request) as sleep:
+            response = self.post({'offer': 1})
+        self.assertEqual(sleep.call_count, 1)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data, {'created': 1})
+        self.assertEqual(response['Idempotent-Replayed'], 'true')
+        self.assertEqual(CountingView.calls, 0)
+
+    @override_settings(IDEMPOTENCY_WAIT_TIMEOUT=0)
+    def test_duplicate_gets_conflict_when_the_first_request_outlasts_the_wait(self):
+        self.in_flight_record({'offer': 1})
+        self.assertEqual(self.post({'offer': 1}).status_code, 409)
+        self.assertEqual(CountingView.calls, 0)
+
+    def test_abandoned_in_flight_record_is_taken_over(self):
+        self.in_flight_record({'offer': 1}, expires_in=-1)
+        self.assertEqual(self.post({'offer': 1}).status_code, 201)
+        self.assertEqual(CountingView.calls, 1)
+        record = IdempotencyRecord.objects.get(key='key-1')
+        self.assertEqual(record.state, 'completed')
+        self.assertGreater(record.expires_at, timezone.now() + timedelta(seconds=settings.IDEMPOTENCY_IN_FLIGHT_TIMEOUT))
@@ -0,0 +1,38 @@
+from functools import lru_cache, partial
+from django.db import models, transaction
+from django.db.models.signals import pre_save, post_delete
+from django.dispatch import receiver
+from .storage import ContentAddressedStorage
+
+
+@lru_cache(maxsize=None)
+def _tracked_fields(model):
+    """
+    Returns the file fields of model that use the content-addressed storage.
+    """
+    return tuple(
+        field for field in model._meta.concrete_fields
+        if isinstance(field, models.FileField) and isinstance(field.storage, ContentAddressedStorage)
+    )
+
+
+@receiver(pre_save)
+def release_replaced_files(sender, instance, raw=False, **kwargs):
+    fields = _tracked_fields(sender)
+    if not fields or raw or instance._state.adding:
+        return
+    previous = sender._default_manager.filter(pk=instance.pk).values(*[field.attname for field in fields]).first()
+    if not previous:
+        return
+    for field in fields:
+        old_name = previous[field.attname]
+        if old_name and old_name != getattr(instance, field.attname).name:
+            transaction.on_commit(partial(field.storage.delete, old_name))
+
+
+@receiver(post_delete)
+def release_deleted_files(sender, instance, **kwargs):
+    for field in _tracked_fields(sender):
+        name = getattr(instance, field.attname).name
+        if name:
+            transaction.on_commit(partial(field.storage.delete, name))
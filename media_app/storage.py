@@ -0,0 +1,93 @@
+import hashlib
+import os
+import tempfile
+from django.core.files.storage import FileSystemStorage
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils.deconstruct import deconstructible
+from .models import MediaBlob
+
+BLOB_PREFIX = 'blobs'
+
+
+@deconstructible
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    File storage that keeps every distinct upload once, named by its SHA-256 digest.
+    Uploads are streamed to disk while hashing, and each stored blob is reference counted
+    in MediaBlob so deleting the last reference reclaims the disk space.
+    Blob names never change content, so their URLs can be cached indefinitely.
+    """
+
+    def get_available_name(self, name, max_length=None):
+        """
+        Returns the name unchanged; the final name is derived from the content in _save.
+        """
+        return name
+
+    def _save(self, name, content):
+        temp_path, digest, size = self._write_temp_file(content)
+        extension = os.path.splitext(name)[1].lower()
+        blob_name = f'{BLOB_PREFIX}/{digest[:2]}/{digest[2:4]}/{digest}{extension}'
+
+        try:
+            with transaction.atomic():
+                updated = MediaBlob.objects.filter(name=blob_name).update(ref_count=F('ref_count') + 1)
+                if not updated:
+                    try:
+                        with transaction.atomic():
+                            MediaBlob.objects.create(name=blob_name, digest=digest, size=size, ref_count=1)
+                    except IntegrityError:
+                        MediaBlob.objects.filter(name=blob_name).update(ref_count=F('ref_count') + 1)
+                self._move_into_place(temp_path, blob_name)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        return blob_name
+
+    def delete(self, name):
+        """
+        Drops one reference to a blob and removes the file once no references remain.
+        Names outside the blob directory are deleted directly.
+        """
+        if not name:
+            return
+        if not name.startswith(f'{BLOB_PREFIX}/'):
+            return super().delete(name)
+
+        with transaction.atomic():
+            MediaBlob.objects.filter(name=name, ref_count__gt=0).update(ref_count=F('ref_count') - 1)
+            removed, _ = MediaBlob.objects.filter(name=name, ref_count=0).delete()
+            if removed:
+                super().delete(name)
+
+    def _write_temp_file(self, content):
+        """
+        Streams content into a temporary file inside the storage while computing its digest.
+        """
+        temp_dir = self.path(f'{BLOB_PREFIX}/tmp')
+        os.makedirs(temp_dir, exist_ok=True)
+        hasher = hashlib.sha256()
+        size = 0
+        if hasattr(content, 'seek'):
+            content.seek(0)
+        with tempfile.NamedTemporaryFile(dir=temp_dir, delete=False) as temp_file:
+            for chunk in content.chunks():
+                if isinstance(chunk, str):
+                    chunk = chunk.encode()
+                hasher.update(chunk)
+                temp_file.write(chunk)
+                size += len(chunk)
+        return temp_file.name, hasher.hexdigest(), size
+
+    def _move_into_place(self, temp_path, blob_name):
+        full_path = self.path(blob_name)
+        if os.path.exists(full_path):
+            return
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        os.replace(temp_path, full_path)
+        if self.file_permissions_mode is not None:
+            os.chmod(full_path, self.file_permissions_mode)
+
+
+content_addressed_storage = ContentAddressedStorage()
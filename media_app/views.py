@@ -0,0 +1,15 @@
+from django.conf import settings
+from django.views.static import serve
+
+BLOB_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+
+def serve_blob(request, path):
+    """
+    Serves a content-addressed media blob with long-lived cache headers during development.
+    Like static(), it is only routed when DEBUG is on; in production the web server serves
+    MEDIA_URL/blobs/ itself and must send BLOB_CACHE_CONTROL.
+    """
+    response = serve(request, f'blobs/{path}', document_root=settings.MEDIA_ROOT)
+    response['Cache-Control'] = BLOB_CACHE_CONTROL
+    return response
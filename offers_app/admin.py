@@ -17,10 +17,12 @@ class OfferAdmin(admin.ModelAdmin):
     def min_price(self, obj):
         return obj.min_price
     min_price.short_description = 'Minimaler Preis'
+    min_price.admin_order_field = 'min_price'
 
     def min_delivery_time(self, obj):
         return obj.min_delivery_time
     min_delivery_time.short_description = 'Minimale Lieferzeit'
+    min_delivery_time.admin_order_field = 'min_delivery_time'
 
 
 @admin.register(OfferDetail)
@@ -1,18 +1,48 @@
 import django_filters
-from ..models import Offer
+from django.db.models import Exists, OuterRef
+from django.db.models.expressions import RawSQL
+from rest_framework import filters
+from ..models import Offer, OfferDetail
+from .. import features, search
 
 
 class OfferFilter(django_filters.FilterSet):
     creator_id = django_filters.NumberFilter(field_name='user', lookup_expr='exact')
     min_price = django_filters.NumberFilter(method='filter_min_price')
     max_delivery_time = django_filters.NumberFilter(method='filter_max_delivery_time')
+    feature = django_filters.CharFilter(method='filter_feature')
 
     class Meta:
         model = Offer
         fields = ['user']
 
     def filter_min_price(self, queryset, name, value):
-        return queryset.filter(details__price__gte=value).distinct()
+        # Offers with at least one detail priced at or above the value, as before the min_price column.
+        return queryset.filter(Exists(OfferDetail.objects.filter(offer=OuterRef('pk'), price__gte=value)))
 
     def filter_max_delivery_time(self, queryset, name, value):
-        return queryset.filter(details__delivery_time_in_days__lte=value).distinct()
+        return queryset.filter(min_delivery_time__lte=value)
+
+    def filter_feature(self, queryset, name, value):
+        return queryset.filter(id__in=features.offers_with_feature(value))
+
+
+class OfferSearchFilter(filters.SearchFilter):
+    """
+    Search backend for offers using the full-text index.
+    Results are ranked by relevance unless an explicit ordering is requested.
+    Falls back to the default LIKE search where the index is not available.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        terms = self.get_search_terms(request)
+        if not terms or not search.is_supported():
+            return super().filter_queryset(request, queryset, view)
+
+        match = search.build_match_query(terms)
+        queryset = queryset.filter(id__in=RawSQL(search.match_sql(), [match]))
+        if not request.query_params.get('ordering'):
+            queryset = queryset.annotate(
+                search_rank=RawSQL(search.rank_sql(), [match])
+            ).order_by('search_rank', '-created_at')
+        return queryset
@@ -1,5 +1,7 @@
 from rest_framework import serializers
+from django.db import transaction
 from ..models import Offer, OfferDetail
+from .. import cards, features
 from profiles_app.models import Profile
 
 
@@ -58,8 +60,8 @@ class OfferListSerializer(serializers.ModelSerializer):
     Includes basic offer information and user details.
     """
     details = serializers.SerializerMethodField()
-    min_price = serializers.ReadOnlyField()
-    min_delivery_time = serializers.ReadOnlyField()
+    min_price = serializers.FloatField(read_only=True)
+    min_delivery_time = serializers.IntegerField(read_only=True)
     user_details = serializers.SerializerMethodField()
 
     class Meta:
@@ -79,8 +81,7 @@ class OfferListSerializer(serializers.ModelSerializer):
         Returns basic user information for the offer creator.
         """
         try:
-            profile = Profile.objects.get(user=obj.user)
-            return UserDetailsSerializer(profile).data
+            return UserDetailsSerializer(obj.user.profile).data
         except Profile.DoesNotExist:
             return None
 
@@ -99,14 +100,19 @@ class OfferCreateSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         """
         Creates an offer with nested offer details.
+        The details are inserted with one bulk INSERT and the offer card is built once.
         """
         details_data = validated_data.pop('details')
-        offer = Offer.objects.create(**validated_data)
+        offer = Offer(**validated_data)
+        created_details = [OfferDetail(offer=offer, **detail_data) for detail_data in details_data]
+        offer.set_min_values(created_details)
+
+        with transaction.atomic():
+            offer.save()
+            OfferDetail.objects.bulk_create(created_details)
+            features.sync_features(created_details)
+            cards.rebuild_cards([offer.pk])
 
-        created_details = []
-        for detail_data in details_data:
-            detail = OfferDetail.objects.create(offer=offer, **detail_data)
-            created_details.append(detail)
         offer._created_details = created_details
         return offer
 
@@ -151,42 +157,58 @@ class OfferUpdateSerializer(serializers.ModelSerializer):
     def update(self, instance, validated_data):
         """
         Updates an offer and its details.
+        Loads all details in one query and writes the changed ones with a single bulk update.
         """
         details_data = validated_data.pop('details', None)
         instance.title = validated_data.get('title', instance.title)
         instance.image = validated_data.get('image', instance.image)
         instance.description = validated_data.get('description', instance.description)
-        instance.save()
-
-        if details_data:
-            for detail_data in details_data:
-                detail_id = detail_data.get('id')
-                offer_type = detail_data.get('offer_type')
-                
-                if not offer_type:
-                    raise serializers.ValidationError("Der Typ (offer_type) muss immer mitgegeben werden, um das Detail eindeutig zu identifizieren.")
-                
-                if detail_id:
-                    try:
-                        detail = OfferDetail.objects.get(id=detail_id, offer=instance)
-                        for field, value in detail_data.items():
-                            if field != 'id' and hasattr(detail, field):
-                                setattr(detail, field, value)
-                        detail.save()
-                    except OfferDetail.DoesNotExist:
-                        pass
-                else:
-                    try:
-                        detail = OfferDetail.objects.get(offer=instance, offer_type=offer_type)
-                        for field, value in detail_data.items():
-                            if field != 'id' and hasattr(detail, field):
-                                setattr(detail, field, value)
-                        detail.save()
-                    except OfferDetail.DoesNotExist:
-                        pass
+
+        with transaction.atomic():
+            if details_data:
+                details = list(instance.details.all())
+                self._apply_detail_updates(details, details_data)
+                instance.set_min_values(details)
+                instance._updated_details = details
+            instance.save()
 
         return instance
 
+    def _apply_detail_updates(self, details, details_data):
+        """
+        Applies the submitted detail data to the loaded details and saves the changed ones.
+        Details are matched by id if given, otherwise by offer_type.
+        """
+        details_by_id = {detail.id: detail for detail in details}
+        details_by_type = {detail.offer_type: detail for detail in details}
+        changed_details = {}
+        changed_fields = set()
+
+        for detail_data in details_data:
+            detail_id = detail_data.get('id')
+            offer_type = detail_data.get('offer_type')
+
+            if not offer_type:
+                raise serializers.ValidationError("Der Typ (offer_type) muss immer mitgegeben werden, um das Detail eindeutig zu identifizieren.")
+
+            if detail_id:
+                detail = details_by_id.get(detail_id)
+            else:
+                detail = details_by_type.get(offer_type)
+            if detail is None:
+                raise serializers.ValidationError({'details': f"Kein Angebotsdetail für '{detail_id or offer_type}' gefunden."})
+
+            for field, value in detail_data.items():
+                if field != 'id':
+                    setattr(detail, field, value)
+                    changed_fields.add(field)
+            changed_details[detail.id] = detail
+
+        if changed_details:
+            OfferDetail.objects.bulk_update(changed_details.values(), sorted(changed_fields))
+            if 'features' in changed_fields:
+                features.sync_features(changed_details.values())
+
     def to_representation(self, instance):
         """
         Returns the updated offer with full details.
@@ -199,7 +221,10 @@ class OfferUpdateSerializer(serializers.ModelSerializer):
             'description': data.get('description'),
             'details': []
         }
-        details = instance.details.all()
+        if hasattr(instance, '_updated_details'):
+            details = instance._updated_details
+        else:
+            details = instance.details.all()
         response_data['details'] = OfferDetailSerializer(details, many=True).data
             
         return response_data
@@ -211,8 +236,8 @@ class OfferRetrieveSerializer(serializers.ModelSerializer):
     Includes full offer details and metadata.
     """
     details = serializers.SerializerMethodField()
-    min_price = serializers.ReadOnlyField()
-    min_delivery_time = serializers.ReadOnlyField()
+    min_price = serializers.FloatField(read_only=True)
+    min_delivery_time = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Offer
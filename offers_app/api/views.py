@@ -1,11 +1,13 @@
 from rest_framework import viewsets, status, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from rest_framework.pagination import PageNumberPagination
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Q, Min
-from ..models import Offer, OfferDetail
+from django.conf import settings
+from django.db.models import Q, Min, Prefetch, Count, Exists, OuterRef
+from ..models import Offer, OfferDetail, Feature
 from .serializers import (
     OfferListSerializer,
     OfferCreateSerializer,
@@ -15,8 +17,12 @@ from .serializers import (
     OfferDetailUpdateSerializer
 )
 from .permissions import IsBusinessUser, IsOfferOwner
-from .filters import OfferFilter
+from .filters import OfferFilter, OfferSearchFilter
+from .. import cache as offer_cache
+from .. import cards, importers
+from core.pagination import KeysetCursorPagination
 from profiles_app.models import Profile
+from idempotency_app.decorators import idempotent
 
 
 class OfferPagination(PageNumberPagination):
@@ -29,18 +35,83 @@ class OfferPagination(PageNumberPagination):
     max_page_size = 6
 
 
-class OfferViewSet(viewsets.ModelViewSet):
+class OfferCursorPagination(KeysetCursorPagination):
+    """
+    Keyset pagination for Offer endpoints, enabled with 'pagination=cursor'.
+    Pages continue from the (field, id) position of the last row, so no COUNT or OFFSET is needed.
+    """
+    page_size = 6
+    page_size_query_param = 'page_size'
+    max_page_size = 6
+    ordering = ('-created_at', '-id')
+    ordering_choices = {
+        'created_at': ('created_at', 'id'),
+        '-created_at': ('-created_at', '-id'),
+        'updated_at': ('updated_at', 'id'),
+        '-updated_at': ('-updated_at', '-id'),
+        'min_price': ('min_price', 'id'),
+        '-min_price': ('-min_price', '-id'),
+    }
+
+
+class BatchFetchMixin:
+    """
+    Adds '?ids=1,2,3' batch lookups to the list action of a ViewSet.
+    A batch is loaded with a single filtered query and checked like a retrieve.
+    """
+
+    def is_batch_request(self):
+        return self.action == 'list' and 'ids' in self.request.query_params
+
+    def get_batch_ids(self):
+        """
+        Parses the 'ids' query parameter into a de-duplicated list of ids.
+        """
+        try:
+            ids = [int(value) for value in self.request.query_params['ids'].split(',') if value.strip()]
+        except ValueError:
+            raise ValidationError({'ids': 'ids muss eine kommagetrennte Liste von Zahlen sein.'})
+        ids = list(dict.fromkeys(ids))
+        if len(ids) > settings.BATCH_FETCH_MAX_IDS:
+            raise ValidationError({'ids': f'Es können maximal {settings.BATCH_FETCH_MAX_IDS} Objekte auf einmal abgefragt werden.'})
+        return ids
+
+    def batch_list_data(self):
+        """
+        Returns the serialized objects for the requested ids in request order.
+        Unknown ids are skipped.
+        """
+        ids = self.get_batch_ids()
+        objects = {obj.pk: obj for obj in self.get_queryset().filter(pk__in=ids)}
+        for obj in objects.values():
+            self.check_object_permissions(self.request, obj)
+        return self.get_serializer([objects[pk] for pk in ids if pk in objects], many=True).data
+
+
+class OfferViewSet(BatchFetchMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing Offer objects.
     Provides CRUD operations for offers with filtering, searching, and ordering capabilities.
     """
     queryset = Offer.objects.all()
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, OfferSearchFilter, filters.OrderingFilter]
     filterset_class = OfferFilter
     search_fields = ['title', 'description']
     ordering_fields = ['updated_at']
     pagination_class = OfferPagination
 
+    @property
+    def paginator(self):
+        """
+        Returns the cursor paginator when the client asks for 'pagination=cursor'.
+        """
+        if not hasattr(self, '_paginator'):
+            if self.request.query_params.get('pagination') == 'cursor':
+                self._paginator = OfferCursorPagination()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
+
     def get_serializer_class(self):
         """
         Returns the appropriate serializer class based on the action.
@@ -50,7 +121,7 @@ class OfferViewSet(viewsets.ModelViewSet):
             return OfferCreateSerializer
         elif self.action in ['update', 'partial_update']:
             return OfferUpdateSerializer
-        elif self.action == 'retrieve':
+        elif self.action == 'retrieve' or self.is_batch_request():
             return OfferRetrieveSerializer
         else:
             return OfferListSerializer
@@ -60,31 +131,187 @@ class OfferViewSet(viewsets.ModelViewSet):
         Returns the appropriate permission classes based on the action.
         Ensures proper access control for different operations.
         """
-        if self.action in ['create']:
+        if self.action in ['create', 'bulk']:
             return [IsAuthenticated(), IsBusinessUser()]
         elif self.action in ['update', 'partial_update', 'destroy']:
             return [IsAuthenticated(), IsOfferOwner()]
-        elif self.action in ['retrieve']:
+        elif self.action in ['retrieve'] or self.is_batch_request():
             return [IsAuthenticated()]
+        elif self.action == 'cache_stats':
+            return [IsAuthenticated(), IsAdminUser()]
         return []
 
     def get_queryset(self):
         """
         Returns the queryset for offers with optional ordering.
+        Loads profiles and details up front for list and retrieve to avoid per-offer queries.
         Supports ordering by minimum price and creation date.
+        Price ordering uses the stored min_price column, so every offer appears exactly once.
         """
         queryset = Offer.objects.all()
+        if self.action == 'retrieve' or self.is_batch_request():
+            queryset = queryset.prefetch_related('details')
+        elif self.action == 'list' and settings.OFFER_CARDS_ENABLED:
+            queryset = queryset.select_related('card')
+        elif self.action == 'list':
+            queryset = queryset.select_related('user__profile').prefetch_related(
+                Prefetch('details', queryset=OfferDetail.objects.only('id', 'offer_id'))
+            )
         ordering = self.request.query_params.get('ordering', None)
         
         if ordering == 'min_price':
-            queryset = queryset.prefetch_related('details').order_by('details__price')
+            queryset = queryset.order_by('min_price', 'id')
         elif ordering == '-min_price':
-            queryset = queryset.prefetch_related('details').order_by('-details__price')
+            queryset = queryset.order_by('-min_price', '-id')
         else:
             queryset = queryset.order_by('-created_at')
 
         return queryset
 
+    def list(self, request, *args, **kwargs):
+        """
+        Lists offers, serving repeated queries from the response cache.
+        With '?ids=1,2,3' returns exactly those offers in full detail.
+        """
+        key = offer_cache.list_key(request)
+        data = offer_cache.get_response(key, 'list')
+        if data is None:
+            if self.is_batch_request():
+                data = self.batch_list_data()
+            elif settings.OFFER_CARDS_ENABLED:
+                data = self._list_from_cards(request)
+            else:
+                data = super().list(request, *args, **kwargs).data
+            offer_cache.set_response(key, data)
+        return Response(data)
+
+    def _list_from_cards(self, request):
+        """
+        Builds the list response from the precomputed offer cards.
+        Offers without a card yet fall back to the list serializer.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        offers = page if page is not None else list(queryset)
+
+        results = []
+        for offer in offers:
+            data = cards.serve_card(offer, request)
+            if data is None:
+                data = self.get_serializer(offer).data
+            results.append(data)
+
+        if page is not None:
+            return self.get_paginated_response(results).data
+        return results
+
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Retrieves a single offer, serving repeated requests from the response cache.
+        """
+        key = offer_cache.detail_key(self.kwargs['pk'])
+        data = offer_cache.get_response(key, 'retrieve')
+        if data is None:
+            data = super().retrieve(request, *args, **kwargs).data
+            offer_cache.set_response(key, data)
+        return Response(data)
+
+    @action(detail=False, methods=['post'], url_path='bulk')
+    def bulk(self, request):
+        """
+        Imports a list of offers in chunked bulk inserts.
+        Invalid rows are reported per row without aborting the others.
+        """
+        rows = request.data
+        if not isinstance(rows, list):
+            return Response({'error': 'Es wird eine Liste von Angeboten erwartet.'}, status=status.HTTP_400_BAD_REQUEST)
+        if len(rows) > settings.OFFER_BULK_IMPORT_MAX_ROWS:
+            return Response(
+                {'error': f'Es können maximal {settings.OFFER_BULK_IMPORT_MAX_ROWS} Angebote auf einmal importiert werden.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        result = importers.import_offers(
+            ((row_number, data, None) for row_number, data in enumerate(rows, start=1)),
+            request.user,
+            OfferCreateSerializer
+        )
+        response_status = status.HTTP_201_CREATED if result['created'] else status.HTTP_400_BAD_REQUEST
+        return Response(result, status=response_status)
+
+    @action(detail=False, methods=['get'], url_path='facets')
+    def facets(self, request):
+        """
+        Returns offer counts per price bucket, delivery time bucket and offer type.
+        Honors the 'search' and 'creator_id' filters and computes all counts in one aggregate query.
+        """
+        key = offer_cache.list_key(request, prefix='facets')
+        data = offer_cache.get_response(key, 'facets')
+        if data is None:
+            filterset = OfferFilter({'creator_id': request.query_params.get('creator_id')}, queryset=Offer.objects.all())
+            if not filterset.is_valid():
+                return Response(filterset.errors, status=status.HTTP_400_BAD_REQUEST)
+            queryset = OfferSearchFilter().filter_queryset(request, filterset.qs, self).order_by()
+            data = self._aggregate_facets(queryset)
+            offer_cache.set_response(key, data)
+        return Response(data, status=status.HTTP_200_OK)
+
+    def _aggregate_facets(self, queryset):
+        """
+        Builds the facet counts for queryset with conditional counts in a single query.
+        Price buckets are cumulative and count what '?min_price=<min>' returns:
+        offers with at least one detail priced at or above the bucket minimum.
+        """
+        price_bounds = [0] + list(settings.OFFER_FACET_PRICE_BUCKETS)
+        delivery_bounds = settings.OFFER_FACET_DELIVERY_BUCKETS
+        offer_types = [offer_type for offer_type, _ in OfferDetail.OFFER_TYPE_CHOICES]
+
+        aggregates = {'total': Count('id')}
+        for index, lower in enumerate(price_bounds):
+            has_price = Exists(OfferDetail.objects.filter(offer=OuterRef('pk'), price__gte=lower))
+            aggregates[f'price_{index}'] = Count('id', filter=Q(has_price))
+        for index, upper in enumerate(delivery_bounds):
+            aggregates[f'delivery_{index}'] = Count('id', filter=Q(min_delivery_time__lte=upper))
+        for offer_type in offer_types:
+            has_type = Exists(OfferDetail.objects.filter(offer=OuterRef('pk'), offer_type=offer_type))
+            aggregates[f'type_{offer_type}'] = Count('id', filter=Q(has_type))
+
+        counts = queryset.aggregate(**aggregates)
+        return {
+            'count': counts['total'],
+            'price_buckets': [
+                {'min': lower, 'count': counts[f'price_{index}']}
+                for index, lower in enumerate(price_bounds)
+            ],
+            'delivery_time_buckets': [
+                {'max_delivery_time': upper, 'count': counts[f'delivery_{index}']}
+                for index, upper in enumerate(delivery_bounds)
+            ],
+            'offer_types': {offer_type: counts[f'type_{offer_type}'] for offer_type in offer_types},
+        }
+
+    @action(detail=False, methods=['get'], url_path='features')
+    def features(self, request):
+        """
+        Returns the most common offer detail features with the number of details using them.
+        Accepts an optional 'limit' query parameter.
+        """
+        try:
+            limit = min(int(request.query_params.get('limit', 20)), settings.OFFER_FEATURES_MAX_LIMIT)
+        except ValueError:
+            return Response({'error': 'limit muss eine Zahl sein.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        features = Feature.objects.filter(detail_count__gt=0).order_by('-detail_count', 'id')[:max(limit, 0)]
+        data = [{'name': feature.name, 'count': feature.detail_count} for feature in features]
+        return Response(data, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=['get'], url_path='cache-stats')
+    def cache_stats(self, request):
+        """
+        Returns hit and miss counters of the offer response cache.
+        """
+        return Response(offer_cache.get_stats(), status=status.HTTP_200_OK)
+
     def perform_create(self, serializer):
         """
         Performs the actual creation of an offer.
@@ -92,10 +319,12 @@ class OfferViewSet(viewsets.ModelViewSet):
         """
         serializer.save(user=self.request.user)
 
+    @idempotent('offers.create')
     def create(self, request, *args, **kwargs):
         """
         Creates a new offer and returns it with 201 status code.
         Overrides default create method to ensure proper status code.
+        Retries with the same Idempotency-Key replay the first response.
         """
         response = super().create(request, *args, **kwargs)
         return Response(response.data, status=status.HTTP_201_CREATED)
@@ -125,7 +354,7 @@ class OfferViewSet(viewsets.ModelViewSet):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
-class OfferDetailViewSet(viewsets.ModelViewSet):
+class OfferDetailViewSet(BatchFetchMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing OfferDetail objects.
     Provides CRUD operations for offer details (individual service packages within offers).
@@ -149,3 +378,11 @@ class OfferDetailViewSet(viewsets.ModelViewSet):
         if self.action in ['update', 'partial_update', 'destroy']:
             return [IsAuthenticated(), IsOfferOwner()]
         return [IsAuthenticated()]
+
+    def list(self, request, *args, **kwargs):
+        """
+        Lists offer details, or exactly the requested ones with '?ids=1,2,3'.
+        """
+        if self.is_batch_request():
+            return Response(self.batch_list_data(), status=status.HTTP_200_OK)
+        return super().list(request, *args, **kwargs)
@@ -0,0 +1,110 @@
+from hashlib import sha256
+from uuid import uuid4
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+LIST_VERSION_KEY = 'offers:list:version'
+DETAIL_VERSION_KEY = 'offers:detail:{}:version'
+STATS_KEY = 'offers:cache:{}:{}'
+CACHED_KINDS = ['list', 'retrieve', 'facets']
+
+
+def _get_version(key):
+    """
+    Returns the current version token stored under key, creating one if missing.
+    Tokens are random so a lost version key can never revive stale entries.
+    """
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid4().hex, None)
+        version = cache.get(key)
+    return version
+
+
+def _bump_version(key):
+    transaction.on_commit(lambda: cache.set(key, uuid4().hex, None))
+
+
+def _increment(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, 1, None):
+            cache.incr(key)
+
+
+def _normalize_params(query_params):
+    """
+    Returns the query parameters as a sorted, hashable representation without empty values.
+    """
+    return sorted(
+        (key, tuple(sorted(value for value in query_params.getlist(key) if value)))
+        for key in query_params
+        if any(query_params.getlist(key))
+    )
+
+
+def list_key(request, prefix='list'):
+    """
+    Returns the cache key for a list-style request based on its normalized query parameters.
+    The host is part of the key because paginated responses contain absolute links.
+    """
+    raw = repr((request.scheme, request.get_host(), request.path, _normalize_params(request.query_params)))
+    digest = sha256(raw.encode()).hexdigest()
+    return f'offers:{prefix}:{_get_version(LIST_VERSION_KEY)}:{digest}'
+
+
+def detail_key(offer_id):
+    """
+    Returns the cache key for the detail representation of an offer.
+    """
+    return f'offers:detail:{offer_id}:{_get_version(DETAIL_VERSION_KEY.format(offer_id))}'
+
+
+def get_response(key, kind):
+    """
+    Returns the cached response data for key and records a hit or miss for kind.
+    """
+    data = cache.get(key)
+    _increment(STATS_KEY.format(kind, 'hits' if data is not None else 'misses'))
+    return data
+
+
+def set_response(key, data):
+    """
+    Stores response data under key for OFFER_CACHE_TIMEOUT seconds.
+    """
+    cache.set(key, data, settings.OFFER_CACHE_TIMEOUT)
+
+
+def invalidate_list():
+    """
+    Invalidates every cached offer list once the current transaction commits.
+    """
+    _bump_version(LIST_VERSION_KEY)
+
+
+def invalidate_offer(offer_id):
+    """
+    Invalidates the cached detail of an offer and all cached lists.
+    """
+    _bump_version(DETAIL_VERSION_KEY.format(offer_id))
+    invalidate_list()
+
+
+def get_stats():
+    """
+    Returns hit and miss counters per cached kind.
+    """
+    stats = {}
+    for kind in CACHED_KINDS:
+        hits = cache.get(STATS_KEY.format(kind, 'hits')) or 0
+        misses = cache.get(STATS_KEY.format(kind, 'misses')) or 0
+        total = hits + misses
+        stats[kind] = {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': round(hits / total, 3) if total else 0.0
+        }
+    return stats
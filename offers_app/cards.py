@@ -0,0 +1,50 @@
+from django.db import transaction
+from django.db.models import Prefetch
+from .models import Offer, OfferCard, OfferDetail
+
+
+def card_queryset():
+    """
+    Returns offers with everything needed to build their cards loaded up front.
+    """
+    return Offer.objects.select_related('user__profile').prefetch_related(
+        Prefetch('details', queryset=OfferDetail.objects.only('id', 'offer_id'))
+    )
+
+
+def build_card_data(offer):
+    """
+    Returns the list representation of an offer as stored in its card.
+    File URLs stay relative and are made absolute when the card is served.
+    """
+    from .api.serializers import OfferListSerializer
+
+    return dict(OfferListSerializer(offer).data)
+
+
+def rebuild_cards(offer_ids):
+    """
+    Rebuilds the cards of the given offers inside one transaction.
+    """
+    offer_ids = list(offer_ids)
+    if not offer_ids:
+        return 0
+    with transaction.atomic():
+        cards = [OfferCard(offer=offer, data=build_card_data(offer)) for offer in card_queryset().filter(pk__in=offer_ids)]
+        OfferCard.objects.bulk_create(
+            cards, update_conflicts=True, unique_fields=['offer'], update_fields=['data', 'updated_at']
+        )
+    return len(cards)
+
+
+def serve_card(offer, request):
+    """
+    Returns the card data of an offer for the given request, or None if it has no card yet.
+    """
+    try:
+        data = dict(offer.card.data)
+    except OfferCard.DoesNotExist:
+        return None
+    if data.get('image'):
+        data['image'] = request.build_absolute_uri(data['image'])
+    return data
@@ -0,0 +1,105 @@
+from collections import defaultdict
+from django.db import transaction
+from django.db.models import F
+from .models import Feature, OfferDetailFeature
+
+MAX_FEATURE_LENGTH = Feature._meta.get_field('name').max_length
+
+
+def normalize(name):
+    """
+    Returns the lookup form of a feature: collapsed whitespace, case-folded.
+    """
+    return ' '.join(str(name).split()).casefold()[:MAX_FEATURE_LENGTH]
+
+
+def _wanted_features(detail):
+    """
+    Returns {normalized_name: display_name} for the features of an offer detail.
+    """
+    features = detail.features if isinstance(detail.features, list) else []
+    wanted = {}
+    for feature in features:
+        normalized = normalize(feature)
+        if normalized and normalized not in wanted:
+            wanted[normalized] = ' '.join(str(feature).split())[:MAX_FEATURE_LENGTH]
+    return wanted
+
+
+def _resolve_features(names):
+    """
+    Returns {normalized_name: Feature} for the given names, creating missing features.
+    """
+    if not names:
+        return {}
+    Feature.objects.bulk_create(
+        [Feature(name=name, normalized_name=normalized) for normalized, name in names.items()],
+        ignore_conflicts=True
+    )
+    return {feature.normalized_name: feature for feature in Feature.objects.filter(normalized_name__in=names)}
+
+
+def _apply_count_deltas(deltas):
+    by_delta = defaultdict(list)
+    for feature_id, delta in deltas.items():
+        if delta:
+            by_delta[delta].append(feature_id)
+    for delta, feature_ids in by_delta.items():
+        Feature.objects.filter(pk__in=feature_ids).update(detail_count=F('detail_count') + delta)
+
+
+def sync_features(details):
+    """
+    Brings the feature tags of the given saved offer details in line with their features lists.
+    """
+    details = [detail for detail in details if detail.pk]
+    if not details:
+        return
+
+    wanted = {detail.pk: _wanted_features(detail) for detail in details}
+    names = {}
+    for detail_features in wanted.values():
+        names.update(detail_features)
+
+    with transaction.atomic():
+        features = _resolve_features(names)
+        existing = defaultdict(dict)
+        for tag_id, detail_id, feature_id in OfferDetailFeature.objects.filter(
+            detail_id__in=wanted
+        ).values_list('id', 'detail_id', 'feature_id'):
+            existing[detail_id][feature_id] = tag_id
+
+        deltas = defaultdict(int)
+        to_create = []
+        to_delete = []
+        for detail in details:
+            wanted_ids = {features[normalized].pk for normalized in wanted[detail.pk]}
+            current = existing[detail.pk]
+            for feature_id in wanted_ids - current.keys():
+                to_create.append(OfferDetailFeature(detail_id=detail.pk, offer_id=detail.offer_id, feature_id=feature_id))
+                deltas[feature_id] += 1
+            for feature_id in current.keys() - wanted_ids:
+                to_delete.append(current[feature_id])
+                deltas[feature_id] -= 1
+
+        if to_delete:
+            OfferDetailFeature.objects.filter(pk__in=to_delete).delete()
+        OfferDetailFeature.objects.bulk_create(to_create)
+        _apply_count_deltas(deltas)
+
+
+def release_features(detail_ids):
+    """
+    Decrements the counts of all features tagged on the given offer details before they are deleted.
+    """
+    deltas = defaultdict(int)
+    for feature_id in OfferDetailFeature.objects.filter(detail_id__in=detail_ids).values_list('feature_id', flat=True):
+        deltas[feature_id] -= 1
+    _apply_count_deltas(deltas)
+
+
+def offers_with_feature(name):
+    """
+    Returns a subquery of the ids of offers having a detail tagged with the feature.
+    """
+    return OfferDetailFeature.objects.filter(feature__normalized_name=normalize(name)).values('offer_id')
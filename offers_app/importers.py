@@ -0,0 +1,122 @@
+import csv
+import json
+from itertools import islice
+from django.db import DatabaseError, transaction
+from .models import Offer, OfferDetail
+from . import cache, cards, features, search
+
+DEFAULT_CHUNK_SIZE = 500
+DETAIL_FIELDS = ['title', 'revisions', 'delivery_time_in_days', 'price', 'features']
+
+
+def read_jsonl(stream):
+    """
+    Yields (row_number, data, error) for every non-empty line of a JSON Lines stream.
+    """
+    for row_number, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield row_number, json.loads(line), None
+        except json.JSONDecodeError as error:
+            yield row_number, None, f'Ungültiges JSON: {error}'
+
+
+def read_csv(stream):
+    """
+    Yields (row_number, data, error) for every row of a CSV stream.
+    Each row holds title and description plus '<offer_type>_<field>' columns for the
+    three details; features are separated by ';'.
+    """
+    reader = csv.DictReader(stream)
+    for row_number, row in enumerate(reader, start=2):
+        details = []
+        for offer_type, _ in OfferDetail.OFFER_TYPE_CHOICES:
+            detail = {field: row.get(f'{offer_type}_{field}') for field in DETAIL_FIELDS}
+            features = detail['features'] or ''
+            detail['features'] = [feature.strip() for feature in features.split(';') if feature.strip()]
+            detail['offer_type'] = offer_type
+            details.append(detail)
+        yield row_number, {
+            'title': row.get('title'),
+            'description': row.get('description'),
+            'details': details
+        }, None
+
+
+def _chunks(rows, chunk_size):
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _validate(serializer_class, row_number, data, error):
+    if error:
+        return None, {'row': row_number, 'errors': error}
+    serializer = serializer_class(data=data)
+    if not serializer.is_valid():
+        return None, {'row': row_number, 'errors': serializer.errors}
+    return serializer.validated_data, None
+
+
+def _insert(user, validated_rows):
+    """
+    Inserts one chunk of validated offers and their details with two bulk INSERTs.
+    """
+    offers = []
+    details = []
+    for validated_data in validated_rows:
+        validated_data = dict(validated_data)
+        details_data = validated_data.pop('details')
+        offer = Offer(user=user, **validated_data)
+        offer_details = [OfferDetail(offer=offer, **detail_data) for detail_data in details_data]
+        offer.set_min_values(offer_details)
+        offers.append(offer)
+        details.extend(offer_details)
+
+    with transaction.atomic():
+        Offer.objects.bulk_create(offers)
+        for detail in details:
+            detail.offer_id = detail.offer.pk
+        OfferDetail.objects.bulk_create(details)
+        features.sync_features(details)
+        cards.rebuild_cards(offer.pk for offer in offers)
+        search.index_offers(offers)
+        cache.invalidate_list()
+    return offers
+
+
+def import_offers(rows, user, serializer_class, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Imports offers for user from (row_number, data, error) tuples.
+    Each row is validated with serializer_class, which the API layer passes in.
+    Rows are validated and inserted chunk by chunk, each chunk in its own transaction.
+    Invalid rows are reported and skipped without aborting the remaining rows.
+    """
+    result = {'created': 0, 'failed': 0, 'offer_ids': [], 'errors': []}
+    for chunk in _chunks(rows, chunk_size):
+        valid_rows = []
+        row_numbers = []
+        for row_number, data, error in chunk:
+            validated_data, row_error = _validate(serializer_class, row_number, data, error)
+            if row_error:
+                result['errors'].append(row_error)
+            else:
+                valid_rows.append(validated_data)
+                row_numbers.append(row_number)
+
+        if valid_rows:
+            try:
+                offers = _insert(user, valid_rows)
+            except DatabaseError as error:
+                result['errors'].extend({'row': row_number, 'errors': str(error)} for row_number in row_numbers)
+            else:
+                result['created'] += len(offers)
+                result['offer_ids'].extend(offer.pk for offer in offers)
+
+    result['failed'] = len(result['errors'])
+    return result
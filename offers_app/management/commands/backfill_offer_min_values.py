@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+from django.db.models import DecimalField, Min, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from offers_app.models import Offer, OfferDetail
+
+
+class Command(BaseCommand):
+    help = 'Fills Offer.min_price and Offer.min_delivery_time from the existing offer details.'
+
+    def handle(self, *args, **options):
+        details = OfferDetail.objects.filter(offer=OuterRef('pk')).values('offer')
+        updated = Offer.objects.update(
+            min_price=Coalesce(
+                Subquery(details.annotate(value=Min('price')).values('value')),
+                Value(0),
+                output_field=DecimalField(max_digits=10, decimal_places=2)
+            ),
+            min_delivery_time=Coalesce(
+                Subquery(details.annotate(value=Min('delivery_time_in_days')).values('value')),
+                Value(0)
+            )
+        )
+        self.stdout.write(self.style.SUCCESS(f'Updated {updated} offers.'))
@@ -0,0 +1,89 @@
+import random
+import time
+from decimal import Decimal
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from auth_app.models import CustomUser
+from offers_app.models import Offer, OfferDetail
+
+
+class Command(BaseCommand):
+    help = (
+        'Compares the legacy join-based min_price ordering with the min_price column. '
+        'Seeds offers inside a transaction that is rolled back afterwards.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--offers', type=int, default=100000)
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            self.seed(options['offers'], options['batch_size'])
+            self.compare(options['repeat'])
+            transaction.set_rollback(True)
+
+    def seed(self, count, batch_size):
+        """
+        Creates the given number of offers with three details each.
+        """
+        user = CustomUser.objects.create_user(
+            username='benchmark_business', email='benchmark@example.com', password=None, type='business'
+        )
+        rng = random.Random(42)
+        started = time.perf_counter()
+        for start in range(0, count, batch_size):
+            offers = []
+            details = []
+            for index in range(start, min(start + batch_size, count)):
+                offer = Offer(user=user, title=f'Offer {index}', description='Benchmark offer')
+                offer_details = [
+                    OfferDetail(
+                        offer=offer,
+                        title=offer_type,
+                        revisions=1,
+                        delivery_time_in_days=rng.randint(1, 30),
+                        price=Decimal(rng.randint(500, 100000)) / 100,
+                        features=[],
+                        offer_type=offer_type
+                    )
+                    for offer_type in ('basic', 'standard', 'premium')
+                ]
+                offer.set_min_values(offer_details)
+                offers.append(offer)
+                details.extend(offer_details)
+            Offer.objects.bulk_create(offers)
+            for detail in details:
+                detail.offer_id = detail.offer.pk
+            OfferDetail.objects.bulk_create(details)
+        self.stdout.write(f'Seeded {count} offers in {time.perf_counter() - started:.1f}s')
+
+    def compare(self, repeat):
+        filters = {'price': 100, 'delivery_time': 10}
+        legacy = (
+            Offer.objects.filter(details__price__gte=filters['price']).distinct()
+            .filter(details__delivery_time_in_days__lte=filters['delivery_time']).distinct()
+            .order_by('details__price')
+        )
+        current = (
+            Offer.objects.filter(min_price__gte=filters['price'], min_delivery_time__lte=filters['delivery_time'])
+            .order_by('min_price', 'id')
+        )
+        for label, queryset in (('legacy join ordering', legacy), ('min_price column', current)):
+            self.stdout.write(self.style.MIGRATE_HEADING(label))
+            self.stdout.write(queryset.explain())
+            self.stdout.write(f'  count:      {self.measure(lambda: queryset.count(), repeat):8.2f} ms')
+            self.stdout.write(f'  first page: {self.measure(lambda: list(queryset[:6]), repeat):8.2f} ms')
+            self.stdout.write(f'  page 1000:  {self.measure(lambda: list(queryset[5994:6000]), repeat):8.2f} ms')
+
+    def measure(self, func, repeat):
+        """
+        Returns the best wall-clock time of func in milliseconds.
+        """
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - started)
+        return min(timings) * 1000
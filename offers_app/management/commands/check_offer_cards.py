@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand
+from offers_app import cards
+from offers_app.models import Offer
+
+
+class Command(BaseCommand):
+    help = 'Compares the precomputed offer cards with the live offer data and optionally repairs them.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repair', action='store_true', help='Rebuild missing and stale cards.')
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        missing = []
+        stale = []
+        last_id = 0
+        while True:
+            offers = list(
+                cards.card_queryset().select_related('card').filter(pk__gt=last_id).order_by('pk')[:batch_size]
+            )
+            if not offers:
+                break
+            last_id = offers[-1].pk
+            for offer in offers:
+                expected = cards.build_card_data(offer)
+                if not hasattr(offer, 'card'):
+                    missing.append(offer.pk)
+                elif offer.card.data != expected:
+                    stale.append(offer.pk)
+
+        self.stdout.write(f'{len(missing)} missing, {len(stale)} stale cards.')
+        for offer_id in stale[:20]:
+            self.stdout.write(f'  stale: offer {offer_id}')
+
+        if options['repair'] and (missing or stale):
+            to_rebuild = missing + stale
+            for start in range(0, len(to_rebuild), batch_size):
+                cards.rebuild_cards(to_rebuild[start:start + batch_size])
+            self.stdout.write(self.style.SUCCESS(f'Rebuilt {len(to_rebuild)} cards.'))
+        elif not missing and not stale:
+            self.stdout.write(self.style.SUCCESS(f'All cards of {Offer.objects.count()} offers are consistent.'))
@@ -0,0 +1,35 @@
+import sys
+from django.core.management.base import BaseCommand, CommandError
+from auth_app.models import CustomUser
+from offers_app import importers
+from offers_app.api.serializers import OfferCreateSerializer
+
+
+class Command(BaseCommand):
+    help = 'Imports offers for a business user from a JSON Lines or CSV file.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="Path to the file, or '-' to read from stdin.")
+        parser.add_argument('--user', required=True, help='Username of the business user owning the offers.')
+        parser.add_argument('--format', choices=['jsonl', 'csv'], help='Defaults to the file extension.')
+        parser.add_argument('--chunk-size', type=int, default=importers.DEFAULT_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        try:
+            user = CustomUser.objects.get(username=options['user'], type='business')
+        except CustomUser.DoesNotExist:
+            raise CommandError(f"No business user named '{options['user']}'.")
+
+        path = options['path']
+        file_format = options['format'] or ('csv' if path.lower().endswith('.csv') else 'jsonl')
+        reader = importers.read_csv if file_format == 'csv' else importers.read_jsonl
+
+        if path == '-':
+            result = importers.import_offers(reader(sys.stdin), user, OfferCreateSerializer, options['chunk_size'])
+        else:
+            with open(path, newline='', encoding='utf-8') as stream:
+                result = importers.import_offers(reader(stream), user, OfferCreateSerializer, options['chunk_size'])
+
+        for error in result['errors']:
+            self.stderr.write(f"Row {error['row']}: {error['errors']}")
+        self.stdout.write(self.style.SUCCESS(f"Created {result['created']} offers, {result['failed']} rows failed."))
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from offers_app import features
+from offers_app.models import Feature, OfferDetail, OfferDetailFeature
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the feature tag index from OfferDetail.features.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            OfferDetailFeature.objects.all().delete()
+            Feature.objects.update(detail_count=0)
+
+            last_id = 0
+            total = 0
+            while True:
+                details = list(
+                    OfferDetail.objects.filter(pk__gt=last_id).only('id', 'offer_id', 'features')
+                    .order_by('pk')[:options['batch_size']]
+                )
+                if not details:
+                    break
+                features.sync_features(details)
+                last_id = details[-1].pk
+                total += len(details)
+
+            Feature.objects.filter(detail_count=0).delete()
+        self.stdout.write(self.style.SUCCESS(f'Indexed features of {total} offer details.'))
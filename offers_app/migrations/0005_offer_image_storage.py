@@ -0,0 +1,19 @@
+# Generated by Django 5.2.5 on 2026-10-18 02:10
+
+import media_app.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0004_offer_fts'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='offer',
+            name='image',
+            field=models.FileField(blank=True, null=True, storage=media_app.storage.ContentAddressedStorage(), upload_to='offer_images/'),
+        ),
+    ]
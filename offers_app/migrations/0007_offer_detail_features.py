@@ -0,0 +1,36 @@
+# Generated by Django 5.2.5 on 2026-10-18 02:14
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0006_offer_card'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Feature',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=200)),
+                ('normalized_name', models.CharField(max_length=200, unique=True)),
+                ('detail_count', models.PositiveIntegerField(db_index=True, default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='OfferDetailFeature',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('detail', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='feature_tags', to='offers_app.offerdetail')),
+                ('feature', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='detail_tags', to='offers_app.feature')),
+                ('offer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='feature_tags', to='offers_app.offer')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['feature', 'offer'], name='offerdetailfeature_feat_offer')],
+                'constraints': [models.UniqueConstraint(fields=('detail', 'feature'), name='unique_offer_detail_feature')],
+            },
+        ),
+    ]
@@ -0,0 +1,16 @@
+# Generated by Django 5.2.5 on 2026-10-18 03:05
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # Cards hold the serialized list representation, which historical models cannot build.
+    # Existing offers get their cards from 'manage.py check_offer_cards --repair' instead;
+    # until then the list serves them through the serializer.
+
+    dependencies = [
+        ('offers_app', '0007_offer_detail_features'),
+        ('profiles_app', '0002_profile_file_storage'),
+    ]
+
+    operations = []
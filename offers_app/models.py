@@ -1,31 +1,42 @@
 from django.db import models
+from django.db.models import Min
 from django.conf import settings
+from media_app.storage import content_addressed_storage
 
 
 class Offer(models.Model):
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='offers')
     title = models.CharField(max_length=200)
-    image = models.FileField(upload_to='offer_images/', null=True, blank=True)
+    image = models.FileField(upload_to='offer_images/', storage=content_addressed_storage, null=True, blank=True)
     description = models.TextField()
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    min_price = models.DecimalField(max_digits=10, decimal_places=2, default=0, editable=False, db_index=True)
+    min_delivery_time = models.IntegerField(default=0, editable=False, db_index=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     def __str__(self):
         return self.title
 
-    @property
-    def min_price(self):
-        details = self.details.all()
-        if details.exists():
-            return float(min(detail.price for detail in details))
-        return 0.0
+    def set_min_values(self, details):
+        """
+        Sets min_price and min_delivery_time from the given details in memory.
+        """
+        details = list(details)
+        self.min_price = min((detail.price for detail in details), default=0)
+        self.min_delivery_time = min((detail.delivery_time_in_days for detail in details), default=0)
 
-    @property
-    def min_delivery_time(self):
-        details = self.details.all()
-        if details.exists():
-            return int(min(detail.delivery_time_in_days for detail in details))
-        return 0
+    def refresh_min_values(self):
+        """
+        Recomputes min_price and min_delivery_time from the stored details.
+        Writes only these two columns so updated_at is left untouched.
+        """
+        values = self.details.aggregate(price=Min('price'), delivery_time=Min('delivery_time_in_days'))
+        self.min_price = values['price'] or 0
+        self.min_delivery_time = values['delivery_time'] or 0
+        Offer.objects.filter(pk=self.pk).update(
+            min_price=self.min_price,
+            min_delivery_time=self.min_delivery_time
+        )
 
 
 class OfferDetail(models.Model):
@@ -45,3 +56,38 @@ class OfferDetail(models.Model):
 
     def __str__(self):
         return f"{self.offer.title} - {self.title}"
+
+
+class OfferCard(models.Model):
+    offer = models.OneToOneField(Offer, on_delete=models.CASCADE, primary_key=True, related_name='card')
+    data = models.JSONField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Card for offer {self.offer_id}"
+
+
+class Feature(models.Model):
+    name = models.CharField(max_length=200)
+    normalized_name = models.CharField(max_length=200, unique=True)
+    detail_count = models.PositiveIntegerField(default=0, db_index=True)
+
+    def __str__(self):
+        return self.name
+
+
+class OfferDetailFeature(models.Model):
+    detail = models.ForeignKey(OfferDetail, on_delete=models.CASCADE, related_name='feature_tags')
+    offer = models.ForeignKey(Offer, on_delete=models.CASCADE, related_name='feature_tags')
+    feature = models.ForeignKey(Feature, on_delete=models.CASCADE, related_name='detail_tags')
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['detail', 'feature'], name='unique_offer_detail_feature'),
+        ]
+        indexes = [
+            models.Index(fields=['feature', 'offer'], name='offerdetailfeature_feat_offer'),
+        ]
+
+    def __str__(self):
+        return f"{self.detail_id} - {self.feature_id}"
@@ -0,0 +1,75 @@
+from django.db import connection
+from .models import Offer
+
+FTS_TABLE = 'offers_app_offer_fts'
+
+
+def is_supported():
+    """
+    Returns whether the full-text index is available on the current database.
+    """
+    return connection.vendor == 'sqlite'
+
+
+def build_match_query(terms):
+    """
+    Builds an FTS5 MATCH expression that requires every term as a prefix.
+    """
+    return ' '.join('"{}"*'.format(term.replace('"', '""')) for term in terms)
+
+
+def match_sql():
+    """
+    Returns the SQL selecting the ids of offers matching a MATCH parameter.
+    """
+    return f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s'
+
+
+def rank_sql():
+    """
+    Returns the correlated SQL computing the relevance rank of the outer offer row.
+    Lower values are more relevant.
+    """
+    return (
+        f'SELECT rank FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s '
+        f'AND rowid = {Offer._meta.db_table}.id'
+    )
+
+
+def index_offers(offers):
+    """
+    Writes title and description of the given offers to the full-text index.
+    """
+    if not is_supported():
+        return
+    rows = [(offer.pk, offer.title, offer.description) for offer in offers]
+    if not rows:
+        return
+    with connection.cursor() as cursor:
+        cursor.executemany(f'DELETE FROM {FTS_TABLE} WHERE rowid = %s', [(row[0],) for row in rows])
+        cursor.executemany(f'INSERT INTO {FTS_TABLE}(rowid, title, description) VALUES (%s, %s, %s)', rows)
+
+
+def remove_offers(offer_ids):
+    """
+    Removes the given offers from the full-text index.
+    """
+    if not is_supported():
+        return
+    with connection.cursor() as cursor:
+        cursor.executemany(f'DELETE FROM {FTS_TABLE} WHERE rowid = %s', [(offer_id,) for offer_id in offer_ids])
+
+
+def rebuild_index():
+    """
+    Replaces the full-text index with the current offers and returns the number of indexed rows.
+    """
+    if not is_supported():
+        return 0
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {FTS_TABLE}')
+        cursor.execute(
+            f'INSERT INTO {FTS_TABLE}(rowid, title, description) '
+            f'SELECT id, title, description FROM {Offer._meta.db_table}'
+        )
+        return cursor.rowcount
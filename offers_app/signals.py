@@ -0,0 +1,116 @@
+from django.db.models.signals import post_save, post_delete, pre_delete
+from django.dispatch import receiver
+from auth_app.models import CustomUser
+from profiles_app.models import Profile
+from .models import Offer, OfferDetail
+from . import cache, cards, features, search
+
+
+def deleted_directly(origin):
+    """
+    Returns whether a detail delete started from the detail itself or a detail queryset,
+    rather than cascading from its offer or the offer's owner.
+    """
+    return isinstance(origin, OfferDetail) or getattr(origin, 'model', None) is OfferDetail
+
+
+@receiver(post_save, sender=OfferDetail)
+def refresh_offer_min_values_on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    instance.offer.refresh_min_values()
+
+
+@receiver(post_delete, sender=OfferDetail)
+def refresh_offer_min_values_on_delete(sender, instance, origin=None, **kwargs):
+    # Details removed by deleting their offer or its owner need no recomputation.
+    if not deleted_directly(origin):
+        return
+    try:
+        offer = instance.offer
+    except Offer.DoesNotExist:
+        return
+    offer.refresh_min_values()
+
+
+@receiver(post_save, sender=Offer)
+def index_offer(sender, instance, **kwargs):
+    search.index_offers([instance])
+
+
+@receiver(post_delete, sender=Offer)
+def remove_offer_from_index(sender, instance, **kwargs):
+    search.remove_offers([instance.pk])
+
+
+@receiver(post_save, sender=Offer)
+@receiver(post_delete, sender=Offer)
+def invalidate_offer_cache(sender, instance, **kwargs):
+    cache.invalidate_offer(instance.pk)
+
+
+@receiver(post_save, sender=OfferDetail)
+@receiver(post_delete, sender=OfferDetail)
+def invalidate_offer_detail_cache(sender, instance, **kwargs):
+    cache.invalidate_offer(instance.offer_id)
+
+
+@receiver(post_save, sender=Profile)
+@receiver(post_delete, sender=Profile)
+def invalidate_offer_list_for_profile(sender, instance, **kwargs):
+    # Profile names are part of user_details in the list, not of the detail view.
+    if Offer.objects.filter(user_id=instance.user_id).exists():
+        cache.invalidate_list()
+
+
+@receiver(post_save, sender=Offer)
+def rebuild_offer_card(sender, instance, created, raw=False, **kwargs):
+    # New offers get their card once their details exist.
+    if created or raw:
+        return
+    cards.rebuild_cards([instance.pk])
+
+
+@receiver(post_save, sender=OfferDetail)
+def rebuild_offer_card_on_detail_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    cards.rebuild_cards([instance.offer_id])
+
+
+@receiver(post_delete, sender=OfferDetail)
+def rebuild_offer_card_on_detail_delete(sender, instance, origin=None, **kwargs):
+    # A cascade from the offer or its owner deletes the offer (and its card) as well.
+    if not deleted_directly(origin):
+        return
+    cards.rebuild_cards([instance.offer_id])
+
+
+@receiver(post_save, sender=Profile)
+def rebuild_offer_cards_for_profile(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    cards.rebuild_cards(Offer.objects.filter(user_id=instance.user_id).values_list('pk', flat=True))
+
+
+@receiver(post_save, sender=CustomUser)
+def rebuild_offer_cards_for_user(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    # Cards embed the username; saves that only touch other columns (e.g. last_login) are skipped.
+    if created or raw or (update_fields is not None and 'username' not in update_fields):
+        return
+    offer_ids = list(Offer.objects.filter(user_id=instance.pk).values_list('pk', flat=True))
+    if offer_ids:
+        cards.rebuild_cards(offer_ids)
+        cache.invalidate_list()
+
+
+@receiver(post_save, sender=OfferDetail)
+def sync_offer_detail_features(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    features.sync_features([instance])
+
+
+@receiver(pre_delete, sender=OfferDetail)
+def release_offer_detail_features(sender, instance, **kwargs):
+    features.release_features([instance.pk])
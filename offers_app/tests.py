@@ -1,3 +1,186 @@
-from django.test import TestCase
+from django.conf import settings
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from auth_app.models import CustomUser
+from .models import Feature, Offer, OfferCard, OfferDetail, OfferDetailFeature
+from . import cache as offer_cache, cards
 
-# Create your tests here.
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}})
+class OfferQueryCountTests(TestCase):
+    """
+    Ensures the offer list and detail endpoints load related data in a constant number of queries.
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        for index in range(6):
+            user = CustomUser.objects.create_user(
+                username=f'business{index}', email=f'business{index}@example.com',
+                password='password', type='business'
+            )
+            offer = Offer.objects.create(user=user, title=f'Offer {index}', description='Description')
+            for price, offer_type in [(50, 'basic'), (100, 'standard'), (200, 'premium')]:
+                OfferDetail.objects.create(
+                    offer=offer, title=offer_type, revisions=1, delivery_time_in_days=5,
+                    price=price, features=['Logo'], offer_type=offer_type
+                )
+        self.offer = offer
+        self.client.force_authenticate(user)
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries)
+
+    def test_list_query_count_does_not_grow_with_page_size(self):
+        small_page = self.count_queries('/api/offers/?page_size=1')
+        full_page = self.count_queries('/api/offers/?page_size=6')
+        self.assertEqual(small_page, full_page)
+
+    def test_list_query_count_is_constant(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get('/api/offers/?page_size=6')
+        self.assertEqual(len(response.data['results']), 6)
+        self.assertLessEqual(len(context.captured_queries), 4)
+        self.assertEqual(response.data['results'][0]['user_details']['username'], 'business5')
+
+    def test_retrieve_query_count_is_constant(self):
+        self.assertLessEqual(self.count_queries(f'/api/offers/{self.offer.id}/'), 3)
+
+    def page_through(self, url, edit=None):
+        ids = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            ids += [offer['id'] for offer in response.data['results']]
+            if edit is not None:
+                edit(ids)
+                edit = None
+            url = response.data['next']
+        return ids
+
+    def test_cursor_pagination_pages_by_created_at(self):
+        ids = self.page_through('/api/offers/?pagination=cursor&ordering=created_at&page_size=4')
+        self.assertEqual(ids, sorted(Offer.objects.values_list('id', flat=True)))
+
+    def test_cursor_pagination_survives_edits_between_pages(self):
+        def edit_first_seen_offer(ids):
+            offer = Offer.objects.get(pk=ids[0])
+            offer.title = f'{offer.title} edited'
+            offer.save()
+            detail = offer.details.get(offer_type='basic')
+            detail.price = 10 if detail.price > 10 else 500
+            detail.save()
+
+        all_ids = set(Offer.objects.values_list('id', flat=True))
+        for ordering in ['created_at', '-created_at', 'updated_at', '-updated_at', 'min_price', '-min_price']:
+            with self.subTest(ordering=ordering):
+                ids = self.page_through(
+                    f'/api/offers/?pagination=cursor&ordering={ordering}&page_size=2', edit_first_seen_offer
+                )
+                # Only the edited offer may move past the cursor and show up a second time.
+                self.assertEqual(set(ids), all_ids)
+                self.assertEqual(len([pk for pk in ids if pk != ids[0]]), len(all_ids) - 1)
+
+    def test_cursor_pagination_previous_link_returns_the_earlier_page(self):
+        first = self.client.get('/api/offers/?pagination=cursor&ordering=min_price&page_size=2')
+        second = self.client.get(first.data['next'])
+        previous = self.client.get(second.data['previous'])
+        self.assertEqual(previous.data['results'], first.data['results'])
+
+    def test_min_price_matches_offers_with_any_detail_at_or_above(self):
+        response = self.client.get('/api/offers/?min_price=150')
+        self.assertEqual(response.data['count'], 6)
+        response = self.client.get('/api/offers/?min_price=250')
+        self.assertEqual(response.data['count'], 0)
+
+    def test_price_facets_match_the_min_price_filter(self):
+        detail = self.offer.details.get(offer_type='premium')
+        detail.price = 300
+        detail.save()
+        facets = self.client.get('/api/offers/facets/').data
+        for bucket in facets['price_buckets']:
+            with self.subTest(min_price=bucket['min']):
+                response = self.client.get(f"/api/offers/?min_price={bucket['min']}")
+                self.assertEqual(bucket['count'], response.data['count'])
+        self.assertEqual([bucket['count'] for bucket in facets['price_buckets']], [6, 6, 6, 1, 0, 0])
+
+
+class OfferCacheTests(TestCase):
+    """
+    Ensures cached offer responses live in the shared cache backend and are invalidated on edits.
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        user = CustomUser.objects.create_user(
+            username='business', email='business@example.com', password='password', type='business'
+        )
+        self.offer = Offer.objects.create(user=user, title='Offer', description='Description')
+        self.client.force_authenticate(user)
+
+    def test_backend_is_shared_between_workers(self):
+        self.assertNotEqual(settings.CACHES['default']['BACKEND'], 'django.core.cache.backends.locmem.LocMemCache')
+
+    def test_edit_invalidates_cached_list(self):
+        self.assertEqual(self.client.get('/api/offers/').data['results'][0]['title'], 'Offer')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.offer.title = 'Renamed'
+            self.offer.save()
+        self.assertEqual(self.client.get('/api/offers/').data['results'][0]['title'], 'Renamed')
+        self.assertEqual(self.client.get('/api/offers/').data['results'][0]['title'], 'Renamed')
+        stats = offer_cache.get_stats()['list']
+        self.assertEqual((stats['hits'], stats['misses']), (1, 2))
+
+
+class OfferOwnerDeleteTests(TestCase):
+    """
+    Ensures deleting a business user removes their offers without leaving dangling rows.
+    """
+
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(
+            username='business', email='business@example.com', password='password', type='business'
+        )
+        self.offer = Offer.objects.create(user=self.user, title='Offer', description='Description')
+        for price, offer_type in [(50, 'basic'), (100, 'standard'), (200, 'premium')]:
+            OfferDetail.objects.create(
+                offer=self.offer, title=offer_type, revisions=1, delivery_time_in_days=5,
+                price=price, features=['Logo'], offer_type=offer_type
+            )
+        cards.rebuild_cards([self.offer.pk])
+
+    def test_deleting_business_user_deletes_offers_and_cards(self):
+        self.user.delete()
+        connection.check_constraints()
+        self.assertFalse(Offer.objects.filter(pk=self.offer.pk).exists())
+        self.assertFalse(OfferCard.objects.exists())
+        self.assertFalse(OfferDetail.objects.exists())
+
+    def test_deleting_business_user_skips_min_value_refresh(self):
+        with CaptureQueriesContext(connection) as context:
+            self.user.delete()
+        updates = [query['sql'] for query in context.captured_queries
+                   if query['sql'].startswith('UPDATE "offers_app_offer"')]
+        self.assertEqual(updates, [])
+
+    def test_deleting_a_detail_rebuilds_the_card(self):
+        self.offer.details.get(offer_type='basic').delete()
+        self.assertEqual(OfferCard.objects.get(offer=self.offer).data['min_price'], 100)
+
+    def test_deleting_business_user_releases_feature_tags(self):
+        self.assertEqual(OfferDetailFeature.objects.filter(offer=self.offer).count(), 3)
+        self.user.delete()
+        connection.check_constraints()
+        self.assertFalse(OfferDetailFeature.objects.exists())
+        self.assertEqual(Feature.objects.get(normalized_name='logo').detail_count, 0)
+
+
+    def test_changing_username_rebuilds_cards(self):
+        self.user.username = 'renamed'
+        self.user.save()
+        self.assertEqual(OfferCard.objects.get(offer=self.offer).data['user_details']['username'], 'renamed')
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Order
+from .models import ArchivedOrder, DailyOrderRollup, Order
 
 
 @admin.register(Order)
@@ -7,7 +7,7 @@ class OrderAdmin(admin.ModelAdmin):
     list_display = ['id', 'title', 'customer_user', 'business_user', 'status', 'price', 'created_at']
     list_filter = ['status', 'offer_type', 'created_at']
     search_fields = ['title', 'customer_user__username', 'business_user__username']
-    readonly_fields = ['created_at', 'updated_at']
+    readonly_fields = ['created_at', 'updated_at', 'due_at']
 
     fieldsets = (
         ('Bestellungsinformationen', {
@@ -20,7 +20,27 @@ class OrderAdmin(admin.ModelAdmin):
             'fields': ('revisions', 'delivery_time_in_days', 'features')
         }),
         ('Zeitstempel', {
-            'fields': ('created_at', 'updated_at'),
+            'fields': ('created_at', 'updated_at', 'due_at'),
             'classes': ('collapse',)
         }),
     )
+
+
+@admin.register(DailyOrderRollup)
+class DailyOrderRollupAdmin(admin.ModelAdmin):
+    list_display = ['business_user', 'day', 'offer_type', 'order_count', 'cancelled_count', 'revenue']
+    list_filter = ['offer_type', 'day']
+    search_fields = ['business_user__username']
+
+
+@admin.register(ArchivedOrder)
+class ArchivedOrderAdmin(admin.ModelAdmin):
+    list_display = ['id', 'title', 'customer_user', 'business_user', 'status', 'price', 'created_at', 'archived_at']
+    list_filter = ['status', 'offer_type']
+    search_fields = ['title', 'customer_user__username', 'business_user__username']
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -1,5 +1,8 @@
 from rest_framework import serializers
+from django.conf import settings
+from django.db import transaction
 from ..models import Order
+from .. import stats
 from offers_app.models import OfferDetail
 
 
@@ -12,10 +15,45 @@ class OrderSerializer(serializers.ModelSerializer):
         model = Order
         fields = ['id', 'customer_user', 'business_user', 'title', 'revisions', 
                  'delivery_time_in_days', 'price', 'features', 'offer_type', 
-                 'status', 'created_at', 'updated_at']
+                 'status', 'created_at', 'updated_at', 'due_at']
         read_only_fields = ['id', 'customer_user', 'business_user', 'title', 
                            'revisions', 'delivery_time_in_days', 'price', 
-                           'features', 'offer_type', 'created_at', 'updated_at']
+                           'features', 'offer_type', 'created_at', 'updated_at', 'due_at']
+
+
+class OrderStatusUpdateSerializer(serializers.Serializer):
+    """
+    Serializer for order status changes.
+    expected_status optionally names the status the client based the change on.
+    """
+    status = serializers.ChoiceField(choices=Order.STATUS_CHOICES)
+    expected_status = serializers.ChoiceField(choices=Order.STATUS_CHOICES, required=False)
+
+
+def build_order(offer_detail, customer_user):
+    """
+    Returns an unsaved in-progress order copying the terms of an offer detail.
+    """
+    order = Order(
+        customer_user=customer_user,
+        business_user=offer_detail.offer.user,
+        title=offer_detail.title,
+        revisions=offer_detail.revisions,
+        delivery_time_in_days=offer_detail.delivery_time_in_days,
+        price=offer_detail.price,
+        features=offer_detail.features,
+        offer_type=offer_detail.offer_type,
+        status='in_progress'
+    )
+    order.set_due_at()
+    return order
+
+
+def offer_detail_queryset():
+    """
+    Returns offer details joined with their offer and its owner.
+    """
+    return OfferDetail.objects.select_related('offer__user')
 
 
 class OrderCreateSerializer(serializers.ModelSerializer):
@@ -32,30 +70,56 @@ class OrderCreateSerializer(serializers.ModelSerializer):
     def validate_offer_detail_id(self, value):
         """
         Validates that the offer detail exists.
+        Loads the detail, its offer and the offer owner in one query and keeps it for create.
         """
-        try:
-            offer_detail = OfferDetail.objects.get(id=value)
-            return value
-        except OfferDetail.DoesNotExist:
+        offer_detail = offer_detail_queryset().filter(id=value).first()
+        if offer_detail is None:
             raise serializers.ValidationError("Offer detail not found.")
+        self._offer_detail = offer_detail
+        return value
 
     def create(self, validated_data):
         """
-        Creates an order from an offer detail.
-        """
-        offer_detail_id = validated_data.pop('offer_detail_id')
-        offer_detail = OfferDetail.objects.get(id=offer_detail_id)
-        
-        order = Order.objects.create(
-            customer_user=self.context['request'].user,
-            business_user=offer_detail.offer.user,
-            title=offer_detail.title,
-            revisions=offer_detail.revisions,
-            delivery_time_in_days=offer_detail.delivery_time_in_days,
-            price=offer_detail.price,
-            features=offer_detail.features,
-            offer_type=offer_detail.offer_type,
-            status='in_progress'
-        )
-        
+        Creates an order from the offer detail loaded during validation.
+        """
+        with transaction.atomic():
+            order = build_order(self._offer_detail, self.context['request'].user)
+            order.save()
         return order
+
+
+class OrderBatchCreateSerializer(serializers.Serializer):
+    """
+    Serializer for creating several orders at once.
+    Creates one order per offer detail with a single bulk insert.
+    """
+    offer_detail_ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        allow_empty=False,
+        max_length=settings.ORDER_BATCH_MAX_SIZE
+    )
+
+    def validate_offer_detail_ids(self, value):
+        """
+        Validates that all offer details exist, loading them in one query.
+        """
+        offer_details = offer_detail_queryset().in_bulk(set(value))
+        missing = [detail_id for detail_id in value if detail_id not in offer_details]
+        if missing:
+            raise serializers.ValidationError(f"Offer detail not found: {', '.join(map(str, missing))}")
+        self._offer_details = offer_details
+        return value
+
+    def create(self, validated_data):
+        """
+        Creates the orders in one transaction and returns them in request order.
+        """
+        customer_user = self.context['request'].user
+        orders = [
+            build_order(self._offer_details[detail_id], customer_user)
+            for detail_id in validated_data['offer_detail_ids']
+        ]
+        with transaction.atomic():
+            Order.objects.bulk_create(orders)
+            stats.record_created(orders)
+        return orders
@@ -1,6 +1,6 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import OrderViewSet, order_count, completed_order_count
+from .views import OrderViewSet, order_count, completed_order_count, order_stats, order_rollups
 
 router = DefaultRouter()
 router.register(r'orders', OrderViewSet, basename='order')
@@ -9,4 +9,6 @@ urlpatterns = [
     path('', include(router.urls)),
     path('order-count/<int:business_user_id>/', order_count, name='order-count'),
     path('completed-order-count/<int:business_user_id>/', completed_order_count, name='completed-order-count'),
+    path('order-stats/<int:business_user_id>/', order_stats, name='order-stats'),
+    path('order-rollups/<int:business_user_id>/', order_rollups, name='order-rollups'),
 ]
@@ -1,18 +1,47 @@
+import heapq
+from datetime import datetime, time, timedelta
+from operator import attrgetter
+from django.conf import settings
 from rest_framework import viewsets, status
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from rest_framework.decorators import action, api_view, permission_classes
 from django.db.models import Q
 from django.shortcuts import get_object_or_404
-from django.http import Http404
-from ..models import Order
-from .serializers import OrderSerializer, OrderCreateSerializer
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from django.http import Http404, StreamingHttpResponse
+from ..models import ArchivedOrder, Order
+from .serializers import (
+    OrderSerializer, OrderCreateSerializer, OrderBatchCreateSerializer, OrderStatusUpdateSerializer
+)
 from .permissions import IsCustomerUser, IsOrderParticipant, IsBusinessUser
+from .. import export, rollups, stats, transitions
+from .renderers import CSVRenderer, NDJSONRenderer
 from auth_app.models import CustomUser
+from idempotency_app.decorators import idempotent
 from rest_framework import serializers
 from rest_framework.exceptions import PermissionDenied
 
 
+def parse_datetime_param(value):
+    """
+    Parses a date or ISO 8601 datetime query parameter into an aware datetime.
+    Returns None for an empty value and raises ValueError for an invalid one.
+    """
+    if not value:
+        return None
+    parsed = parse_datetime(value)
+    if parsed is None:
+        parsed_date = parse_date(value)
+        if parsed_date is None:
+            raise ValueError(value)
+        parsed = datetime.combine(parsed_date, time.min)
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
 class OrderViewSet(viewsets.ModelViewSet):
     """
     ViewSet for managing Order objects.
@@ -26,39 +55,85 @@ class OrderViewSet(viewsets.ModelViewSet):
         """
         Returns orders based on user role.
         Admin users can see all orders, regular users see only their own orders.
+        The list uses a UNION of the customer and business index scans.
+        The due date filters of the list are applied to both branches of the UNION.
         """
         if self.request.user.is_staff:
-            return Order.objects.all().order_by('-created_at')
+            return Order.objects.filter(self.due_filter).order_by('-created_at')
+        if self.action == 'list':
+            return Order.objects.filter(self.due_filter).for_participant(self.request.user)
         return Order.objects.filter(
             Q(customer_user=self.request.user) | Q(business_user=self.request.user)
         ).order_by('-created_at')
 
+    due_filter = Q()
+
+    def list(self, request, *args, **kwargs):
+        """
+        Lists orders.
+        ?overdue=true keeps in-progress orders past their due date, ?due_before= orders due before a date.
+        ?include_archived=true also returns orders moved to the archive.
+        """
+        try:
+            due_before = parse_datetime_param(request.query_params.get('due_before'))
+        except ValueError:
+            return Response({'error': 'Ungültiges Datum für due_before. Erwartet wird YYYY-MM-DD oder ein ISO-8601-Zeitstempel.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        due_filter = Q()
+        if request.query_params.get('overdue', '').lower() in ['true', '1']:
+            due_filter &= Q(status='in_progress', due_at__lt=timezone.now())
+        if due_before:
+            due_filter &= Q(due_at__lt=due_before)
+        self.due_filter = due_filter
+        if request.query_params.get('include_archived', '').lower() in ['true', '1']:
+            return self._list_with_archived(request)
+        return super().list(request, *args, **kwargs)
+
+    def _list_with_archived(self, request):
+        """
+        Lists the orders together with the matching archived orders, newest first.
+        Both tables are read in created_at order and merged without re-sorting.
+        """
+        if request.user.is_staff:
+            archived = ArchivedOrder.objects.filter(self.due_filter).order_by('-created_at')
+        else:
+            archived = ArchivedOrder.objects.filter(self.due_filter).for_participant(request.user)
+        orders = heapq.merge(self.get_queryset(), archived, key=attrgetter('created_at'), reverse=True)
+        serializer = self.get_serializer(list(orders), many=True)
+        return Response(serializer.data)
+
     def get_serializer_class(self):
         """
         Returns the appropriate serializer class based on the action.
         """
         if self.action == 'create':
             return OrderCreateSerializer
+        elif self.action == 'batch':
+            return OrderBatchCreateSerializer
         return OrderSerializer
 
     def get_permissions(self):
         """
         Returns the appropriate permission classes based on the action.
         """
-        if self.action == 'create':
+        if self.action in ['create', 'batch']:
             return [IsAuthenticated(), IsCustomerUser()]
         elif self.action in ['list', 'retrieve']:
             return [IsAuthenticated()]
         elif self.action in ['update', 'partial_update']:
             return [IsAuthenticated()]
+        elif self.action == 'export':
+            return [IsAuthenticated(), IsBusinessUser()]
         elif self.action == 'destroy':
             return [IsAuthenticated(), IsAdminUser()]
         return super().get_permissions()
 
+    @idempotent('orders.create')
     def create(self, request, *args, **kwargs):
         """
         Creates a new order and returns it with 201 status code.
         Handles 404 error when offer_detail_id doesn't exist.
+        Retries with the same Idempotency-Key replay the first response.
         """
         try:
             serializer = self.get_serializer(data=request.data)
@@ -73,41 +148,96 @@ class OrderViewSet(viewsets.ModelViewSet):
                 return Response({'error': 'Das angegebene Angebotsdetail wurde nicht gefunden.'}, status=status.HTTP_404_NOT_FOUND)
             return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
-    def update(self, request, *args, **kwargs):
+    @action(detail=False, methods=['post'], url_path='batch')
+    @idempotent('orders.batch')
+    def batch(self, request):
         """
-        Updates an order.
-        Handles 404 and permission errors with appropriate status codes.
+        Creates one order per offer detail in a single transaction.
+        Returns 404 if any of the offer details does not exist.
         """
         try:
-            order_id = self.kwargs.get('pk')
-            order = get_object_or_404(Order, id=order_id)
+            serializer = self.get_serializer(data=request.data)
+            serializer.is_valid(raise_exception=True)
+            orders = serializer.save()
 
-            if not request.user.is_staff and order.business_user != request.user:
-                return Response({'error': 'Benutzer hat keine Berechtigung, diese Bestellung zu aktualisieren.'}, status=status.HTTP_403_FORBIDDEN)
-            
-            return super().update(request, *args, **kwargs)
-        except Http404:
-            return Response({'error': 'Die angegebene Bestellung wurde nicht gefunden.'}, status=status.HTTP_404_NOT_FOUND)
-        except Exception as e:
+            response_serializer = OrderSerializer(orders, many=True)
+            return Response(response_serializer.data, status=status.HTTP_201_CREATED)
+        except serializers.ValidationError as e:
+
+            if "Offer detail not found" in str(e):
+                return Response({'error': 'Mindestens ein angegebenes Angebotsdetail wurde nicht gefunden.'}, status=status.HTTP_404_NOT_FOUND)
             return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
+    @action(detail=False, methods=['get'], url_path='export',
+            renderer_classes=[CSVRenderer, NDJSONRenderer])
+    def export(self, request):
+        """
+        Streams the business user's orders as CSV (default) or NDJSON.
+        Supports the since, until (created_at range) and status query parameters.
+        """
+        try:
+            since = parse_datetime_param(request.query_params.get('since'))
+            until = parse_datetime_param(request.query_params.get('until'))
+        except ValueError:
+            return Response({'error': 'Ungültiges Datum. Erwartet wird YYYY-MM-DD oder ein ISO-8601-Zeitstempel.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        order_status = request.query_params.get('status')
+        if order_status and order_status not in dict(Order.STATUS_CHOICES):
+            return Response({'error': f"Ungültiger Status '{order_status}'."}, status=status.HTTP_400_BAD_REQUEST)
+
+        export_format = request.accepted_renderer.format
+        content_type, iter_rows = export.EXPORT_FORMATS[export_format]
+        queryset = export.export_queryset(request.user, since, until, order_status)
+        response = StreamingHttpResponse(iter_rows(queryset), content_type=content_type)
+        response['Content-Disposition'] = f'attachment; filename="orders.{export_format}"'
+        return response
+
+    def update(self, request, *args, **kwargs):
+        """
+        Updates the status of an order.
+        Handles 404, permission and conflict errors with appropriate status codes.
+        """
+        return self._change_status(request, partial=False)
+
     def partial_update(self, request, *args, **kwargs):
         """
-        Partially updates an order.
-        Handles 404 and permission errors with appropriate status codes.
+        Partially updates the status of an order.
+        Handles 404, permission and conflict errors with appropriate status codes.
+        """
+        return self._change_status(request, partial=True)
+
+    def _change_status(self, request, partial):
+        """
+        Loads the order once and applies the status change as a conditional UPDATE.
+        Returns 409 if the order changed status concurrently.
         """
         try:
-            order_id = self.kwargs.get('pk')
-            order = get_object_or_404(Order, id=order_id)
-            
-            if not request.user.is_staff and order.business_user != request.user:
-                return Response({'error': 'Benutzer hat keine Berechtigung, diese Bestellung zu aktualisieren.'}, status=status.HTTP_403_FORBIDDEN)
-            
-            return super().partial_update(request, *args, **kwargs)
+            order = get_object_or_404(Order, id=self.kwargs.get('pk'))
         except Http404:
             return Response({'error': 'Die angegebene Bestellung wurde nicht gefunden.'}, status=status.HTTP_404_NOT_FOUND)
-        except Exception as e:
-            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        if not request.user.is_staff and order.business_user_id != request.user.id:
+            return Response({'error': 'Benutzer hat keine Berechtigung, diese Bestellung zu aktualisieren.'}, status=status.HTTP_403_FORBIDDEN)
+
+        if partial and 'status' not in request.data:
+            return Response(OrderSerializer(order).data, status=status.HTTP_200_OK)
+
+        serializer = OrderStatusUpdateSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response({'error': str(serializer.errors)}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            transitions.change_status(
+                order,
+                serializer.validated_data['status'],
+                serializer.validated_data.get('expected_status')
+            )
+        except transitions.InvalidTransition:
+            return Response({'error': f"Statuswechsel von '{order.status}' zu '{serializer.validated_data['status']}' ist nicht erlaubt."}, status=status.HTTP_400_BAD_REQUEST)
+        except transitions.StatusConflict:
+            return Response({'error': 'Die Bestellung wurde zwischenzeitlich geändert.'}, status=status.HTTP_409_CONFLICT)
+
+        return Response(OrderSerializer(order).data, status=status.HTTP_200_OK)
 
 
 @api_view(['GET'])
@@ -115,19 +245,12 @@ class OrderViewSet(viewsets.ModelViewSet):
 def order_count(request, business_user_id):
     """
     Returns the count of in-progress orders for a specific business user.
+    Reads the maintained status counters instead of counting orders.
     """
-    try:
-        business_user = get_object_or_404(CustomUser, id=business_user_id, type='business')
-        count = Order.objects.filter(
-            business_user=business_user,
-            status='in_progress'
-        ).count()
-
-        return Response({'order_count': count}, status=status.HTTP_200_OK)
-    except Http404:
+    counts = stats.business_status_counts(business_user_id)
+    if counts is None:
         return Response({'error': 'No CustomUser matches the given query.'}, status=status.HTTP_404_NOT_FOUND)
-    except Exception as e:
-        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    return Response({'order_count': counts['in_progress']}, status=status.HTTP_200_OK)
 
 
 @api_view(['GET'])
@@ -135,16 +258,56 @@ def order_count(request, business_user_id):
 def completed_order_count(request, business_user_id):
     """
     Returns the count of completed orders for a specific business user.
+    Reads the maintained status counters instead of counting orders.
     """
-    try:
-        business_user = get_object_or_404(CustomUser, id=business_user_id, type='business')
-        count = Order.objects.filter(
-            business_user=business_user,
-            status='completed'
-        ).count()
-
-        return Response({'completed_order_count': count}, status=status.HTTP_200_OK)
-    except Http404:
+    counts = stats.business_status_counts(business_user_id)
+    if counts is None:
         return Response({'error': 'No CustomUser matches the given query.'}, status=status.HTTP_404_NOT_FOUND)
-    except Exception as e:
-        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    return Response({'completed_order_count': counts['completed']}, status=status.HTTP_200_OK)
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def order_stats(request, business_user_id):
+    """
+    Returns the order count per status for a specific business user.
+    """
+    counts = stats.business_status_counts(business_user_id)
+    if counts is None:
+        return Response({'error': 'No CustomUser matches the given query.'}, status=status.HTTP_404_NOT_FOUND)
+    return Response({'business_user': business_user_id, **counts}, status=status.HTTP_200_OK)
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def order_rollups(request, business_user_id):
+    """
+    Returns the order time series of a business user from the daily rollups.
+    Supports start and end (YYYY-MM-DD, default: the last 30 days), bucket (day, week, month) and offer_type.
+    Only the business user and admins may read it.
+    """
+    if not request.user.is_staff and request.user.id != business_user_id:
+        return Response({'error': 'Benutzer hat keine Berechtigung, diese Auswertung einzusehen.'}, status=status.HTTP_403_FORBIDDEN)
+    if not CustomUser.objects.filter(pk=business_user_id, type='business').exists():
+        return Response({'error': 'No CustomUser matches the given query.'}, status=status.HTTP_404_NOT_FOUND)
+
+    bucket = request.query_params.get('bucket', 'day')
+    if bucket not in rollups.BUCKETS:
+        return Response({'error': f"Ungültige Gruppierung '{bucket}'. Erlaubt sind: {', '.join(rollups.BUCKETS)}."}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        end = parse_date(request.query_params.get('end') or '') or timezone.localdate()
+        start = parse_date(request.query_params.get('start') or '') or end - timedelta(days=settings.ORDER_ROLLUP_DEFAULT_DAYS - 1)
+    except ValueError:
+        start = end = None
+    if start is None or end is None or start > end:
+        return Response({'error': 'Ungültiger Zeitraum. Erwartet werden start und end im Format YYYY-MM-DD.'}, status=status.HTTP_400_BAD_REQUEST)
+
+    series = rollups.time_series(business_user_id, start, end, bucket, request.query_params.get('offer_type'))
+    return Response({
+        'business_user': business_user_id,
+        'bucket': bucket,
+        'start': start,
+        'end': end,
+        'results': series,
+    }, status=status.HTTP_200_OK)
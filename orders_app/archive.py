@@ -0,0 +1,50 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from django.db import transaction
+from .models import ArchivedOrder, Order
+
+FINISHED_STATUSES = ['completed', 'cancelled']
+
+_archiving = ContextVar('orders_archiving', default=False)
+
+
+def is_archiving():
+    """
+    Returns whether orders are currently being moved to the archive.
+    Order deletes in that case must not touch the status counters or rollups.
+    """
+    return _archiving.get()
+
+
+@contextmanager
+def archiving():
+    """
+    Marks the enclosed order deletes as moves into the archive.
+    """
+    token = _archiving.set(True)
+    try:
+        yield
+    finally:
+        _archiving.reset(token)
+
+
+def archivable_orders(cutoff):
+    """
+    Returns finished orders last changed before cutoff.
+    """
+    return Order.objects.filter(status__in=FINISHED_STATUSES, updated_at__lt=cutoff).order_by('id')
+
+
+def archive_batch(cutoff, batch_size):
+    """
+    Moves up to batch_size finished orders older than cutoff into the archive in one transaction.
+    Returns the number of orders moved.
+    """
+    with transaction.atomic():
+        orders = list(archivable_orders(cutoff).select_for_update()[:batch_size])
+        if not orders:
+            return 0
+        ArchivedOrder.objects.bulk_create([ArchivedOrder.from_order(order) for order in orders])
+        with archiving():
+            Order.objects.filter(pk__in=[order.pk for order in orders]).delete()
+    return len(orders)
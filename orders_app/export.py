@@ -0,0 +1,64 @@
+import csv
+import json
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from .models import Order
+
+EXPORT_FIELDS = [
+    'id', 'customer_user', 'business_user', 'title', 'revisions', 'delivery_time_in_days',
+    'price', 'features', 'offer_type', 'status', 'created_at', 'updated_at', 'due_at',
+]
+
+
+def export_queryset(business_user, since=None, until=None, status=None):
+    """
+    Returns the export rows of a business user's orders, oldest first.
+    Served by the (business_user, status, created_at) and (business_user, created_at) indexes.
+    """
+    queryset = Order.objects.filter(business_user=business_user)
+    if status:
+        queryset = queryset.filter(status=status)
+    if since:
+        queryset = queryset.filter(created_at__gte=since)
+    if until:
+        queryset = queryset.filter(created_at__lt=until)
+    return queryset.order_by('created_at', 'id').values_list(*EXPORT_FIELDS)
+
+
+def _iterate(queryset):
+    return queryset.iterator(chunk_size=settings.ORDER_EXPORT_CHUNK_SIZE)
+
+
+class _Echo:
+    """
+    File-like object whose write returns the value so csv.writer can feed a generator.
+    """
+    def write(self, value):
+        return value
+
+
+def iter_csv(queryset):
+    """
+    Yields the header and one CSV line per order, fetching rows in chunks.
+    """
+    writer = csv.writer(_Echo())
+    yield writer.writerow(EXPORT_FIELDS)
+    features_index = EXPORT_FIELDS.index('features')
+    for row in _iterate(queryset):
+        row = list(row)
+        row[features_index] = ';'.join(map(str, row[features_index] or []))
+        yield writer.writerow(row)
+
+
+def iter_ndjson(queryset):
+    """
+    Yields one JSON document per order and line, fetching rows in chunks.
+    """
+    for row in _iterate(queryset):
+        yield json.dumps(dict(zip(EXPORT_FIELDS, row)), cls=DjangoJSONEncoder) + '\n'
+
+
+EXPORT_FORMATS = {
+    'csv': ('text/csv; charset=utf-8', iter_csv),
+    'ndjson': ('application/x-ndjson; charset=utf-8', iter_ndjson),
+}
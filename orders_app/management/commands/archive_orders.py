@@ -0,0 +1,49 @@
+from datetime import datetime, time, timedelta
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from orders_app import archive
+
+
+class Command(BaseCommand):
+    help = (
+        'Moves completed and cancelled orders last changed before a cutoff into the archive table in batches. '
+        'Counters and rollups keep including the archived orders.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--before', help='Cutoff date (YYYY-MM-DD). Defaults to ORDER_ARCHIVE_AFTER_DAYS days ago.'
+        )
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--dry-run', action='store_true', help='Only report how many orders would be archived.')
+        parser.add_argument('--analyze', action='store_true', help='Refresh the planner statistics afterwards.')
+
+    def handle(self, *args, **options):
+        if options['before']:
+            before = parse_date(options['before'])
+            if before is None:
+                raise CommandError('--before must be a date in the format YYYY-MM-DD.')
+            cutoff = timezone.make_aware(datetime.combine(before, time.min))
+        else:
+            cutoff = timezone.now() - timedelta(days=settings.ORDER_ARCHIVE_AFTER_DAYS)
+
+        if options['dry_run']:
+            count = archive.archivable_orders(cutoff).count()
+            self.stdout.write(f'{count} orders finished before {cutoff:%Y-%m-%d} would be archived.')
+            return
+
+        total = 0
+        while True:
+            moved = archive.archive_batch(cutoff, options['batch_size'])
+            if not moved:
+                break
+            total += moved
+            self.stdout.write(f'  archived {total} orders')
+
+        if options['analyze'] and total:
+            with connection.cursor() as cursor:
+                cursor.execute('ANALYZE')
+        self.stdout.write(self.style.SUCCESS(f'Archived {total} orders finished before {cutoff:%Y-%m-%d}.'))
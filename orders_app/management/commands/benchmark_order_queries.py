@@ -0,0 +1,128 @@
+import random
+import time
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+from auth_app.models import CustomUser
+from orders_app.models import Order
+
+COMPOSITE_INDEXES = [
+    'order_customer_created_idx',
+    'order_business_created_idx',
+    'order_business_status_idx',
+]
+
+
+class Command(BaseCommand):
+    help = (
+        'Compares the OR-based participant order query with the UNION of index range scans. '
+        'Seeds orders inside a transaction that is rolled back afterwards.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--orders', type=int, default=1000000)
+        parser.add_argument('--users', type=int, default=2000)
+        parser.add_argument('--batch-size', type=int, default=10000)
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        repeat = options['repeat']
+        with transaction.atomic():
+            user = self.seed(options['orders'], options['users'], options['batch_size'])
+
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    'SELECT sql FROM sqlite_master WHERE type = %s AND name IN (%s, %s, %s)',
+                    ['index'] + COMPOSITE_INDEXES
+                )
+                index_sql = [row[0] for row in cursor.fetchall()]
+                for name in COMPOSITE_INDEXES:
+                    cursor.execute(f'DROP INDEX {name}')
+            self.report('before: OR across both foreign keys', lambda: self.or_queryset(user), repeat)
+            self.report('before: business status count', lambda: self.status_count(user), repeat)
+
+            with connection.cursor() as cursor:
+                for sql in index_sql:
+                    cursor.execute(sql)
+                cursor.execute('ANALYZE')
+            self.report('after: UNION with composite indexes', lambda: Order.objects.for_participant(user), repeat)
+            self.report('after: business status count', lambda: self.status_count(user), repeat)
+            transaction.set_rollback(True)
+
+    def seed(self, count, user_count, batch_size):
+        """
+        Creates users and the given number of orders spread across them.
+        Returns the user whose orders are queried.
+        """
+        started = time.perf_counter()
+        users = CustomUser.objects.bulk_create([
+            CustomUser(
+                username=f'benchmark_user_{index}',
+                email=f'benchmark_user_{index}@example.com',
+                type='business' if index % 4 == 0 else 'customer'
+            )
+            for index in range(user_count)
+        ])
+        business_ids = [user.pk for user in users if user.type == 'business']
+        customer_ids = [user.pk for user in users if user.type == 'customer']
+        rng = random.Random(42)
+        now = timezone.now()
+        statuses = [status for status, _ in Order.STATUS_CHOICES]
+
+        for start in range(0, count, batch_size):
+            orders = [
+                Order(
+                    customer_user_id=rng.choice(customer_ids),
+                    business_user_id=rng.choice(business_ids),
+                    title='Benchmark order',
+                    revisions=1,
+                    delivery_time_in_days=rng.randint(1, 30),
+                    price=rng.randint(5, 1000),
+                    features=[],
+                    offer_type='basic',
+                    status=rng.choice(statuses),
+                    created_at=now - timedelta(minutes=index)
+                )
+                for index in range(start, min(start + batch_size, count))
+            ]
+            for order in orders:
+                order.set_due_at()
+            Order.objects.bulk_create(orders)
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+        self.stdout.write(f'Seeded {count} orders in {time.perf_counter() - started:.1f}s')
+        return CustomUser.objects.get(pk=business_ids[0])
+
+    def or_queryset(self, user):
+        return Order.objects.filter(Q(customer_user=user) | Q(business_user=user)).order_by('-created_at')
+
+    def status_count(self, user):
+        return Order.objects.filter(business_user=user, status='in_progress').order_by()
+
+    def report(self, label, make_queryset, repeat):
+        """
+        Prints the query plan and timings of the queryset built by make_queryset.
+        """
+        self.stdout.write(self.style.MIGRATE_HEADING(label))
+        self.stdout.write(make_queryset().explain())
+        label = 'all rows' if make_queryset().ordered else 'count'
+        self.stdout.write(f'  {label + ":":<10} {self.measure(make_queryset, repeat):8.2f} ms')
+        if make_queryset().ordered:
+            self.stdout.write(f'  {"first 20:":<10} {self.measure(lambda: make_queryset()[:20], repeat):8.2f} ms')
+
+    def measure(self, make_queryset, repeat):
+        """
+        Returns the best wall-clock time in milliseconds of evaluating a fresh queryset.
+        """
+        timings = []
+        for _ in range(repeat):
+            queryset = make_queryset()
+            started = time.perf_counter()
+            if queryset.ordered:
+                list(queryset)
+            else:
+                queryset.count()
+            timings.append(time.perf_counter() - started)
+        return min(timings) * 1000
@@ -0,0 +1,47 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from orders_app.models import Order, OrderStatusCount
+
+
+class Command(BaseCommand):
+    help = (
+        'Lists in-progress orders past their due date, grouped by business user. '
+        'Each business user is one range scan on the (business_user, status, due_at) index.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--business-user', type=int, action='append', dest='business_user_ids',
+            help='Only list the overdue orders of this business user id (repeatable).'
+        )
+        parser.add_argument('--explain', action='store_true', help='Print the query plan of the first scan.')
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        business_user_ids = options['business_user_ids']
+        if business_user_ids is None:
+            business_user_ids = list(
+                OrderStatusCount.objects.filter(status='in_progress', count__gt=0)
+                .order_by('business_user_id').values_list('business_user_id', flat=True)
+            )
+
+        total = 0
+        explained = not options['explain']
+        for business_user_id in business_user_ids:
+            overdue = (
+                Order.objects.filter(business_user_id=business_user_id, status='in_progress', due_at__lt=now)
+                .order_by('due_at')
+                .values_list('id', 'title', 'due_at')
+            )
+            if not explained:
+                self.stdout.write(overdue.explain())
+                explained = True
+            orders = list(overdue)
+            if not orders:
+                continue
+            total += len(orders)
+            self.stdout.write(self.style.MIGRATE_HEADING(f'Business user {business_user_id}: {len(orders)} overdue'))
+            for order_id, title, due_at in orders:
+                self.stdout.write(f'  #{order_id} {title} due {due_at:%Y-%m-%d %H:%M} ({(now - due_at).days} days late)')
+
+        self.stdout.write(self.style.SUCCESS(f'{total} overdue orders.'))
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from orders_app import rollups
+
+
+class Command(BaseCommand):
+    help = 'Recomputes the daily order rollups from the orders table.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--business-user', type=int, action='append', dest='business_user_ids',
+            help='Only rebuild the rollups of this business user id (repeatable).'
+        )
+
+    def handle(self, *args, **options):
+        written = rollups.rebuild_rollups(options['business_user_ids'])
+        self.stdout.write(self.style.SUCCESS(f'Wrote {written} daily order rollups.'))
@@ -0,0 +1,41 @@
+from collections import Counter
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+from orders_app.models import ArchivedOrder, Order, OrderStatusCount
+
+
+class Command(BaseCommand):
+    help = 'Recounts orders (including archived ones) per business user and status and repairs drifted counters.'
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            actual = Counter()
+            for model in [Order, ArchivedOrder]:
+                for row in model.objects.order_by().values('business_user', 'status').annotate(total=Count('id')):
+                    actual[(row['business_user'], row['status'])] += row['total']
+            stored = {
+                (counter.business_user_id, counter.status): counter
+                for counter in OrderStatusCount.objects.all()
+            }
+
+            to_create = []
+            to_update = []
+            for key, total in actual.items():
+                counter = stored.pop(key, None)
+                if counter is None:
+                    to_create.append(OrderStatusCount(business_user_id=key[0], status=key[1], count=total))
+                elif counter.count != total:
+                    counter.count = total
+                    to_update.append(counter)
+            for counter in stored.values():
+                if counter.count != 0:
+                    counter.count = 0
+                    to_update.append(counter)
+
+            OrderStatusCount.objects.bulk_create(to_create)
+            OrderStatusCount.objects.bulk_update(to_update, ['count'])
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Created {len(to_create)} and repaired {len(to_update)} order counters.'
+        ))
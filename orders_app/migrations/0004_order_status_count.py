@@ -0,0 +1,40 @@
+# Generated by Django 5.2.5 on 2026-10-18 02:16
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def fill_order_status_counts(apps, schema_editor):
+    Order = apps.get_model('orders_app', 'Order')
+    OrderStatusCount = apps.get_model('orders_app', 'OrderStatusCount')
+    rows = Order.objects.order_by().values('business_user', 'status').annotate(total=Count('id'))
+    OrderStatusCount.objects.bulk_create([
+        OrderStatusCount(business_user_id=row['business_user'], status=row['status'], count=row['total'])
+        for row in rows
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders_app', '0003_alter_order_status'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrderStatusCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('in_progress', 'In Progress'), ('completed', 'Completed'), ('cancelled', 'Cancelled')], max_length=20)),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('business_user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='order_status_counts', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('business_user', 'status'), name='unique_business_user_status')],
+            },
+        ),
+        migrations.RunPython(fill_order_status_counts, migrations.RunPython.noop),
+    ]
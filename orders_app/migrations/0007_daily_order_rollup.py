@@ -0,0 +1,68 @@
+# Generated by Django 5.2.5 on 2026-10-18 02:25
+
+import django.db.models.deletion
+from django.conf import settings
+from decimal import Decimal
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import Coalesce, TruncDate
+
+
+def fill_daily_order_rollups(apps, schema_editor):
+    Order = apps.get_model('orders_app', 'Order')
+    DailyOrderRollup = apps.get_model('orders_app', 'DailyOrderRollup')
+    active = ~Q(status='cancelled')
+    rows = (
+        Order.objects.order_by()
+        .annotate(day=TruncDate('created_at'))
+        .values('business_user', 'day', 'offer_type')
+        .annotate(
+            total=Count('id'),
+            completed=Count('id', filter=Q(status='completed')),
+            cancelled=Count('id', filter=Q(status='cancelled')),
+            revenue_sum=Coalesce(Sum('price', filter=active), Decimal(0)),
+            delivery_days=Coalesce(Sum('delivery_time_in_days', filter=active), 0),
+        )
+    )
+    DailyOrderRollup.objects.bulk_create([
+        DailyOrderRollup(
+            business_user_id=row['business_user'],
+            day=row['day'],
+            offer_type=row['offer_type'],
+            order_count=row['total'],
+            completed_count=row['completed'],
+            cancelled_count=row['cancelled'],
+            revenue=row['revenue_sum'],
+            delivery_days_total=row['delivery_days'],
+        )
+        for row in rows
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders_app', '0006_order_business_status_created_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyOrderRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('offer_type', models.CharField(max_length=20)),
+                ('order_count', models.IntegerField(default=0)),
+                ('completed_count', models.IntegerField(default=0)),
+                ('cancelled_count', models.IntegerField(default=0)),
+                ('revenue', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('delivery_days_total', models.IntegerField(default=0)),
+                ('business_user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_order_rollups', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('business_user', 'day', 'offer_type'), name='unique_business_user_day_offer_type')],
+            },
+        ),
+        migrations.RunPython(fill_daily_order_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.5 on 2026-10-18 02:30
+
+from datetime import timedelta
+from django.conf import settings
+from django.db import migrations, models
+
+
+def fill_order_due_at(apps, schema_editor):
+    Order = apps.get_model('orders_app', 'Order')
+    batch = []
+    for order in Order.objects.only('id', 'created_at', 'delivery_time_in_days').iterator(chunk_size=1000):
+        order.due_at = order.created_at + timedelta(days=order.delivery_time_in_days)
+        batch.append(order)
+        if len(batch) >= 1000:
+            Order.objects.bulk_update(batch, ['due_at'])
+            batch = []
+    Order.objects.bulk_update(batch, ['due_at'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders_app', '0007_daily_order_rollup'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='order',
+            name='due_at',
+            field=models.DateTimeField(editable=False, null=True),
+        ),
+        migrations.RunPython(fill_order_due_at, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='order',
+            name='due_at',
+            field=models.DateTimeField(editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['status', 'due_at'], name='order_status_due_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['business_user', 'status', 'due_at'], name='order_business_status_due_idx'),
+        ),
+    ]
@@ -1,5 +1,18 @@
+from datetime import timedelta
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
+
+
+class OrderQuerySet(models.QuerySet):
+    def for_participant(self, user):
+        """
+        Returns the orders where user is the customer or the business user, newest first.
+        Combines two index range scans with UNION ALL instead of an OR across both foreign keys.
+        """
+        as_customer = self.filter(customer_user=user).order_by()
+        as_business = self.filter(business_user=user).exclude(customer_user=user).order_by()
+        return as_customer.union(as_business, all=True).order_by('-created_at')
 
 
 class Order(models.Model):
@@ -8,6 +21,9 @@ class Order(models.Model):
         ('completed', 'Completed'),
         ('cancelled', 'Cancelled'),
     ]
+    STATUS_TRANSITIONS = {
+        'in_progress': ('completed', 'cancelled'),
+    }
 
     customer_user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -26,9 +42,130 @@ class Order(models.Model):
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='in_progress')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    due_at = models.DateTimeField(editable=False)
+
+    objects = OrderQuerySet.as_manager()
 
     def __str__(self):
         return f"Order {self.id}: {self.title} - {self.status}"
 
+    def set_due_at(self):
+        """
+        Sets due_at to the creation time (or now for new orders) plus the delivery time.
+        """
+        self.due_at = (self.created_at or timezone.now()) + timedelta(days=self.delivery_time_in_days)
+
+    def save(self, *args, **kwargs):
+        if self.due_at is None:
+            self.set_due_at()
+        super().save(*args, **kwargs)
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['customer_user', 'created_at'], name='order_customer_created_idx'),
+            models.Index(fields=['business_user', 'created_at'], name='order_business_created_idx'),
+            models.Index(fields=['business_user', 'status', 'created_at'], name='order_business_status_idx'),
+            models.Index(fields=['status', 'due_at'], name='order_status_due_idx'),
+            models.Index(fields=['business_user', 'status', 'due_at'], name='order_business_status_due_idx'),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_status = instance.__dict__.get('status')
+        return instance
+
+
+class OrderStatusCount(models.Model):
+    business_user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='order_status_counts')
+    status = models.CharField(max_length=20, choices=Order.STATUS_CHOICES)
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['business_user', 'status'], name='unique_business_user_status'),
+        ]
+
+    def __str__(self):
+        return f"{self.business_user_id} - {self.status}: {self.count}"
+
+
+class DailyOrderRollup(models.Model):
+    """
+    Orders, revenue and delivery time of a business user per creation day and offer type.
+    Revenue and delivery time cover the orders that are not cancelled.
+    """
+    business_user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='daily_order_rollups')
+    day = models.DateField()
+    offer_type = models.CharField(max_length=20)
+    order_count = models.IntegerField(default=0)
+    completed_count = models.IntegerField(default=0)
+    cancelled_count = models.IntegerField(default=0)
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    delivery_days_total = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['business_user', 'day', 'offer_type'], name='unique_business_user_day_offer_type'),
+        ]
+
+    def __str__(self):
+        return f"{self.business_user_id} - {self.day} - {self.offer_type}: {self.order_count}"
+
+
+class ArchivedOrder(models.Model):
+    """
+    Completed or cancelled order moved out of the Order table by the archive_orders command.
+    Keeps the original id, so API clients see the same order.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    customer_user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='archived_customer_orders')
+    business_user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='archived_business_orders')
+    title = models.CharField(max_length=200)
+    revisions = models.IntegerField()
+    delivery_time_in_days = models.IntegerField()
+    price = models.DecimalField(max_digits=10, decimal_places=2)
+    features = models.JSONField(default=list)
+    offer_type = models.CharField(max_length=20)
+    status = models.CharField(max_length=20, choices=Order.STATUS_CHOICES)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    due_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    objects = OrderQuerySet.as_manager()
+
+    ARCHIVED_FIELDS = [
+        'id', 'customer_user_id', 'business_user_id', 'title', 'revisions', 'delivery_time_in_days',
+        'price', 'features', 'offer_type', 'status', 'created_at', 'updated_at', 'due_at',
+    ]
+
+    def __str__(self):
+        return f"Archived order {self.id}: {self.title} - {self.status}"
+
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['customer_user', 'created_at'], name='archived_customer_created_idx'),
+            models.Index(fields=['business_user', 'created_at'], name='archived_business_created_idx'),
+        ]
+
+    @classmethod
+    def from_order(cls, order):
+        """
+        Returns an unsaved archive copy of order.
+        """
+        return cls(**{field: getattr(order, field) for field in cls.ARCHIVED_FIELDS})
@@ -0,0 +1,174 @@
+from collections import defaultdict
+from decimal import Decimal
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import Coalesce, TruncDate, TruncMonth, TruncWeek
+from django.utils import timezone
+from .models import ArchivedOrder, DailyOrderRollup, Order
+
+
+def _key(order):
+    return (order.business_user_id, timezone.localdate(order.created_at), order.offer_type)
+
+
+def _contribution(order, sign=1):
+    """
+    Returns the rollup values one order adds (sign=1) or removes (sign=-1).
+    """
+    active = order.status != 'cancelled'
+    return {
+        'order_count': sign,
+        'completed_count': sign if order.status == 'completed' else 0,
+        'cancelled_count': sign if order.status == 'cancelled' else 0,
+        'revenue': sign * Decimal(order.price) if active else Decimal(0),
+        'delivery_days_total': sign * order.delivery_time_in_days if active else 0,
+    }
+
+
+def _adjust_rollups(deltas):
+    """
+    Applies {(business_user_id, day, offer_type): {field: delta}} to the rollups with atomic updates.
+    """
+    for (business_user_id, day, offer_type), values in deltas.items():
+        values = {field: delta for field, delta in values.items() if delta}
+        if not values:
+            continue
+        rollups = DailyOrderRollup.objects.filter(business_user_id=business_user_id, day=day, offer_type=offer_type)
+        if rollups.update(**{field: F(field) + delta for field, delta in values.items()}):
+            continue
+        try:
+            with transaction.atomic():
+                DailyOrderRollup.objects.create(
+                    business_user_id=business_user_id, day=day, offer_type=offer_type, **values)
+        except IntegrityError:
+            rollups.update(**{field: F(field) + delta for field, delta in values.items()})
+
+
+def _merge(deltas, key, values):
+    for field, delta in values.items():
+        deltas[key][field] = deltas[key].get(field, 0) + delta
+
+
+def record_created(orders):
+    """
+    Adds newly inserted orders to their day's rollup.
+    """
+    deltas = defaultdict(dict)
+    for order in orders:
+        _merge(deltas, _key(order), _contribution(order))
+    _adjust_rollups(deltas)
+
+
+def record_status_change(order, old_status):
+    """
+    Moves an order's contribution from its old status to its current one.
+    """
+    if old_status == order.status:
+        return
+    deltas = defaultdict(dict)
+    _merge(deltas, _key(order), _contribution(Order(
+        price=order.price, delivery_time_in_days=order.delivery_time_in_days, status=old_status), sign=-1))
+    _merge(deltas, _key(order), _contribution(order))
+    _adjust_rollups(deltas)
+
+
+def record_deleted(order):
+    """
+    Removes a deleted order from its day's rollup.
+    """
+    _adjust_rollups({_key(order): _contribution(order, sign=-1)})
+
+
+def _aggregate(orders):
+    """
+    Returns {(business_user_id, day, offer_type): values} for the given orders.
+    """
+    active = ~Q(status='cancelled')
+    rows = (
+        orders.order_by()
+        .annotate(day=TruncDate('created_at'))
+        .values('business_user', 'day', 'offer_type')
+        .annotate(
+            total=Count('id'),
+            completed=Count('id', filter=Q(status='completed')),
+            cancelled=Count('id', filter=Q(status='cancelled')),
+            revenue_sum=Coalesce(Sum('price', filter=active), Decimal(0)),
+            delivery_days=Coalesce(Sum('delivery_time_in_days', filter=active), 0),
+        )
+    )
+    return {
+        (row['business_user'], row['day'], row['offer_type']): {
+            'order_count': row['total'],
+            'completed_count': row['completed'],
+            'cancelled_count': row['cancelled'],
+            'revenue': row['revenue_sum'],
+            'delivery_days_total': row['delivery_days'],
+        }
+        for row in rows.iterator()
+    }
+
+
+def rebuild_rollups(business_user_ids=None):
+    """
+    Recomputes the rollups from the orders and archived orders, optionally only for the given business users.
+    Returns the number of rollup rows written.
+    """
+    sources = [Order.objects.all(), ArchivedOrder.objects.all()]
+    rollups = DailyOrderRollup.objects.all()
+    if business_user_ids is not None:
+        sources = [orders.filter(business_user_id__in=business_user_ids) for orders in sources]
+        rollups = rollups.filter(business_user_id__in=business_user_ids)
+
+    totals = defaultdict(dict)
+    for orders in sources:
+        for key, values in _aggregate(orders).items():
+            _merge(totals, key, values)
+
+    with transaction.atomic():
+        rollups.delete()
+        created = DailyOrderRollup.objects.bulk_create([
+            DailyOrderRollup(business_user_id=business_user_id, day=day, offer_type=offer_type, **values)
+            for (business_user_id, day, offer_type), values in totals.items()
+        ], batch_size=1000)
+    return len(created)
+
+
+BUCKETS = {
+    'day': F('day'),
+    'week': TruncWeek('day'),
+    'month': TruncMonth('day'),
+}
+
+
+def time_series(business_user_id, start, end, bucket='day', offer_type=None):
+    """
+    Returns the rollups of a business user between start and end (inclusive) summed per bucket.
+    """
+    rollups = DailyOrderRollup.objects.filter(business_user_id=business_user_id, day__range=(start, end))
+    if offer_type:
+        rollups = rollups.filter(offer_type=offer_type)
+    rows = (
+        rollups.order_by()
+        .annotate(period=BUCKETS[bucket])
+        .values('period')
+        .annotate(
+            orders=Sum('order_count'),
+            completed=Sum('completed_count'),
+            cancelled=Sum('cancelled_count'),
+            revenue_sum=Sum('revenue'),
+            delivery_days=Sum('delivery_days_total'),
+        )
+        .order_by('period')
+    )
+    series = []
+    for row in rows:
+        active = row['orders'] - row['cancelled']
+        series.append({
+            'period': row['period'],
+            'order_count': row['orders'],
+            'completed_count': row['completed'],
+            'cancelled_count': row['cancelled'],
+            'revenue': row['revenue_sum'],
+            'average_delivery_time': round(row['delivery_days'] / active, 2) if active else None,
+        })
+    return series
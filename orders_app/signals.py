@@ -0,0 +1,20 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import Order
+from . import archive, stats
+
+
+@receiver(post_save, sender=Order)
+def update_order_stats_on_save(sender, instance, created, raw=False, **kwargs):
+    if not raw:
+        if created:
+            stats.record_created([instance])
+        else:
+            stats.record_status_change(instance, getattr(instance, '_loaded_status', instance.status))
+    instance._loaded_status = instance.status
+
+
+@receiver(post_delete, sender=Order)
+def update_order_stats_on_delete(sender, instance, **kwargs):
+    if not archive.is_archiving():
+        stats.record_deleted(instance)
@@ -0,0 +1,73 @@
+from collections import Counter
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from auth_app.models import CustomUser
+from .models import Order, OrderStatusCount
+from . import rollups
+
+
+def _adjust_counts(deltas):
+    """
+    Applies {(business_user_id, status): delta} to the status counters with atomic updates.
+    """
+    for (business_user_id, status), delta in deltas.items():
+        if not delta:
+            continue
+        counters = OrderStatusCount.objects.filter(business_user_id=business_user_id, status=status)
+        if counters.update(count=F('count') + delta) or delta < 0:
+            continue
+        try:
+            with transaction.atomic():
+                OrderStatusCount.objects.create(business_user_id=business_user_id, status=status, count=delta)
+        except IntegrityError:
+            counters.update(count=F('count') + delta)
+
+
+def record_created(orders):
+    """
+    Counts newly inserted orders and adds them to the daily rollups.
+    """
+    with transaction.atomic():
+        _adjust_counts(Counter((order.business_user_id, order.status) for order in orders))
+        rollups.record_created(orders)
+
+
+def record_status_change(order, old_status):
+    """
+    Moves an order from its old status counter to its current one and updates its daily rollup.
+    """
+    if old_status == order.status:
+        return
+    with transaction.atomic():
+        _adjust_counts({
+            (order.business_user_id, old_status): -1,
+            (order.business_user_id, order.status): 1,
+        })
+        rollups.record_status_change(order, old_status)
+
+
+def record_deleted(order):
+    """
+    Removes a deleted order from its status counter and its daily rollup.
+    """
+    with transaction.atomic():
+        _adjust_counts({(order.business_user_id, order.status): -1})
+        rollups.record_deleted(order)
+
+
+def business_status_counts(business_user_id):
+    """
+    Returns {status: count} for a business user in one indexed query,
+    or None if no business user with this id exists.
+    """
+    rows = list(
+        CustomUser.objects.filter(pk=business_user_id, type='business')
+        .values_list('order_status_counts__status', 'order_status_counts__count')
+    )
+    if not rows:
+        return None
+    counts = {status: 0 for status, _ in Order.STATUS_CHOICES}
+    for status, count in rows:
+        if status is not None:
+            counts[status] = count
+    return counts
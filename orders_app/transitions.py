@@ -0,0 +1,50 @@
+from django.db import transaction
+from django.utils import timezone
+from .models import Order
+from . import stats
+
+
+class InvalidTransition(Exception):
+    """
+    Raised when the requested status cannot follow the current one.
+    """
+
+
+class StatusConflict(Exception):
+    """
+    Raised when the order no longer has the status the change was based on.
+    """
+
+
+def can_transition(old_status, new_status):
+    """
+    Returns whether an order may move from old_status to new_status.
+    """
+    return new_status in Order.STATUS_TRANSITIONS.get(old_status, ())
+
+
+def change_status(order, new_status, expected_status=None):
+    """
+    Moves order to new_status with a single conditional UPDATE of status and updated_at.
+    The row is only written if it still has expected_status (default: the loaded status),
+    so concurrent changes raise StatusConflict instead of overwriting each other.
+    """
+    expected_status = expected_status or order.status
+    if expected_status != order.status:
+        raise StatusConflict(order.status)
+    if new_status == expected_status:
+        return order
+    if not can_transition(expected_status, new_status):
+        raise InvalidTransition(expected_status, new_status)
+
+    now = timezone.now()
+    with transaction.atomic():
+        updated = Order.objects.filter(pk=order.pk, status=expected_status).update(
+            status=new_status, updated_at=now)
+        if not updated:
+            raise StatusConflict(expected_status)
+        order.status = new_status
+        order.updated_at = now
+        stats.record_status_change(order, expected_status)
+    order._loaded_status = new_status
+    return order
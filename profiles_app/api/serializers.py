@@ -1,6 +1,17 @@
 from rest_framework import serializers
 from ..models import Profile
 from auth_app.models import CustomUser
+from reviews_app.models import BusinessRatingSummary
+
+
+def get_rating_summary(user):
+    """
+    Returns the rating summary of a business user, or an empty one if it has no reviews yet.
+    """
+    try:
+        return user.rating_summary
+    except BusinessRatingSummary.DoesNotExist:
+        return BusinessRatingSummary(business_user=user)
 
 
 class ProfileSerializer(serializers.ModelSerializer):
@@ -25,23 +36,41 @@ class ProfileSerializer(serializers.ModelSerializer):
                 data[field] = ''
         if data.get('user') is None:
             data['user'] = 0
+        if instance.user.type == 'business':
+            summary = get_rating_summary(instance.user)
+            data['review_count'] = summary.review_count
+            data['average_rating'] = summary.average_rating
         return data
 
 
 class ProfileListSerializer(serializers.ModelSerializer):
     """
     Serializer for listing business profiles.
-    Excludes email and created_at fields.
+    Excludes email and created_at fields and includes the rating summary.
     """
     username = serializers.CharField(source='user.username', read_only=True)
     type = serializers.CharField(source='user.type', read_only=True)
+    review_count = serializers.SerializerMethodField()
+    average_rating = serializers.SerializerMethodField()
 
     class Meta:
         model = Profile
         fields = ['user', 'username', 'first_name', 'last_name', 'file', 'location', 
-                 'tel', 'description', 'working_hours', 'type']
+                 'tel', 'description', 'working_hours', 'type', 'review_count', 'average_rating']
         read_only_fields = ['user', 'username', 'type']
 
+    def get_review_count(self, obj):
+        """
+        Returns the review count from the maintained rating summary.
+        """
+        return get_rating_summary(obj.user).review_count
+
+    def get_average_rating(self, obj):
+        """
+        Returns the average rating from the maintained rating summary.
+        """
+        return get_rating_summary(obj.user).average_rating
+
     def to_representation(self, instance):
         data = super().to_representation(instance)
         for field in ['first_name', 'last_name', 'location', 'tel', 'description', 'working_hours']:
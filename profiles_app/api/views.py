@@ -28,7 +28,7 @@ class ProfileDetailView(generics.RetrieveUpdateAPIView):
         Checks if the current user is the owner of this profile.
         """
         pk = self.kwargs.get('pk')
-        profile = get_object_or_404(Profile, user_id=pk)
+        profile = get_object_or_404(Profile.objects.select_related('user__rating_summary'), user_id=pk)
         
         if self.request.method not in ['GET', 'HEAD', 'OPTIONS']:
             if profile.user != self.request.user:
@@ -83,9 +83,13 @@ class BusinessProfilesView(generics.ListAPIView):
 
     def get_queryset(self):
         """
-        Returns all business user profiles.
+        Returns all business user profiles with their rating summary joined.
         """
-        return Profile.objects.filter(user__type='business').order_by('user__username')
+        return (
+            Profile.objects.filter(user__type='business')
+            .select_related('user__rating_summary')
+            .order_by('user__username')
+        )
 
     def list(self, request, *args, **kwargs):
         """
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.5 on 2026-10-18 02:10
+
+import media_app.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='profile',
+            name='file',
+            field=models.FileField(blank=True, null=True, storage=media_app.storage.ContentAddressedStorage(), upload_to='profile_pictures/'),
+        ),
+    ]
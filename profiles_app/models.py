@@ -1,12 +1,13 @@
 from django.db import models
 from django.conf import settings
+from media_app.storage import content_addressed_storage
 
 
 class Profile(models.Model):
     user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='profile')
     first_name = models.CharField(max_length=100, blank=True, default='')
     last_name = models.CharField(max_length=100, blank=True, default='')
-    file = models.FileField(upload_to='profile_pictures/', null=True, blank=True)
+    file = models.FileField(upload_to='profile_pictures/', storage=content_addressed_storage, null=True, blank=True)
     location = models.CharField(max_length=200, blank=True, default='')
     tel = models.CharField(max_length=20, blank=True, default='')
     description = models.TextField(blank=True, default='')
@@ -1,11 +1,20 @@
 from django.contrib import admin
-from .models import Review
+from .models import Review, BusinessRatingSummary
 
 
 @admin.register(Review)
 class ReviewAdmin(admin.ModelAdmin):
     list_display = ['id', 'reviewer', 'business_user', 'rating', 'created_at', 'updated_at']
+    list_select_related = ['reviewer', 'business_user']
     list_filter = ['rating', 'created_at', 'updated_at']
     search_fields = ['reviewer__username', 'business_user__username', 'description']
-    readonly_fields = ['created_at', 'updated_at']
+    readonly_fields = ['business_user', 'created_at', 'updated_at']
     ordering = ['-updated_at']
+
+
+@admin.register(BusinessRatingSummary)
+class BusinessRatingSummaryAdmin(admin.ModelAdmin):
+    list_display = ['business_user', 'review_count', 'average_rating', 'updated_at']
+    search_fields = ['business_user__username']
+    readonly_fields = ['business_user', 'review_count', 'rating_sum', 'rating_1', 'rating_2', 'rating_3',
+                       'rating_4', 'rating_5', 'updated_at']
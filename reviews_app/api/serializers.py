@@ -3,23 +3,22 @@ from ..models import Review
 from offers_app.models import Offer
 
 
+def first_offer_of(business_user_id):
+    """
+    Returns the oldest offer of a business user, which reviews given per business are attached to.
+    """
+    return Offer.objects.filter(user_id=business_user_id).order_by('created_at', 'id').first()
+
+
 class ReviewSerializer(serializers.ModelSerializer):
     """
     Main serializer for Review objects.
     Used for listing and retrieving reviews.
     """
-    business_user = serializers.SerializerMethodField()
-
     class Meta:
         model = Review
         fields = ['id', 'business_user', 'reviewer', 'rating', 'description', 'created_at', 'updated_at']
-        read_only_fields = ['id', 'reviewer', 'created_at', 'updated_at']
-
-    def get_business_user(self, obj):
-        """
-        Returns the business user ID from the associated offer.
-        """
-        return obj.offer.user.id
+        read_only_fields = ['id', 'business_user', 'reviewer', 'created_at', 'updated_at']
 
 
 class ReviewUpdateSerializer(serializers.ModelSerializer):
@@ -33,18 +32,10 @@ class ReviewListSerializer(serializers.ModelSerializer):
     Serializer for listing reviews.
     Used specifically for review list endpoints.
     """
-    business_user = serializers.SerializerMethodField()
-
     class Meta:
         model = Review
         fields = ['id', 'reviewer', 'rating', 'description', 'created_at', 'updated_at', 'business_user']
-        read_only_fields = ['id', 'reviewer', 'created_at', 'updated_at']
-
-    def get_business_user(self, obj):
-        """
-        Returns the business user ID from the associated offer.
-        """
-        return obj.offer.user.id
+        read_only_fields = ['id', 'business_user', 'reviewer', 'created_at', 'updated_at']
 
 
 class ReviewUpdateOnlySerializer(serializers.ModelSerializer):
@@ -76,7 +67,7 @@ class ReviewCreateOnlySerializer(serializers.ModelSerializer):
         business_user_id = data.get('business_user') or data.get('business_user_id')
         
         if not data.get('offer') and business_user_id:
-            offer = Offer.objects.filter(user_id=business_user_id).first()
+            offer = first_offer_of(business_user_id)
             if offer:
                 data['offer'] = offer
             else:
@@ -1,10 +1,11 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import ReviewViewSet
+from .views import ReviewViewSet, rating_summary
 
 router = DefaultRouter()
 router.register(r'reviews', ReviewViewSet, basename='review')
 
 urlpatterns = [
+    path('reviews/summary/<int:business_user_id>/', rating_summary, name='review-summary'),
     path('', include(router.urls)),
 ]
@@ -1,16 +1,19 @@
 from rest_framework import viewsets, status
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.decorators import api_view, permission_classes
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import OrderingFilter
 from rest_framework.pagination import PageNumberPagination
+from django.db import transaction
 from django.http import Http404
 from rest_framework.exceptions import PermissionDenied
-from ..models import Review
-from .serializers import ReviewSerializer, ReviewUpdateOnlySerializer, ReviewCreateOnlySerializer
+from ..models import Review, BusinessRatingSummary
+from .serializers import ReviewSerializer, ReviewUpdateOnlySerializer, ReviewCreateOnlySerializer, first_offer_of
 from .permissions import IsCustomerUser, IsReviewOwner
 from rest_framework.exceptions import ValidationError
-from offers_app.models import Offer
+from auth_app.models import CustomUser
+from core.pagination import KeysetCursorPagination
 
 
 class ReviewPagination(PageNumberPagination):
@@ -23,6 +26,23 @@ class ReviewPagination(PageNumberPagination):
     max_page_size = 6
 
 
+class ReviewCursorPagination(KeysetCursorPagination):
+    """
+    Keyset pagination for the review list, enabled with 'pagination=cursor'.
+    Pages continue from the (field, id) position of the last row, so no COUNT or OFFSET is needed.
+    """
+    page_size = 6
+    page_size_query_param = 'page_size'
+    max_page_size = 6
+    ordering = ('-updated_at', '-id')
+    ordering_choices = {
+        'updated_at': ('updated_at', 'id'),
+        '-updated_at': ('-updated_at', '-id'),
+        'rating': ('rating', 'id'),
+        '-rating': ('-rating', '-id'),
+    }
+
+
 class ReviewViewSet(viewsets.ModelViewSet):
     """
     ViewSet for managing Review objects.
@@ -44,57 +64,54 @@ class ReviewViewSet(viewsets.ModelViewSet):
 
     def list(self, request, *args, **kwargs):
         """
-        Lists reviews with advanced filtering and pagination.
+        Lists reviews with advanced filtering and optional keyset pagination.
         Supports filtering by business user, offer, and reviewer.
+        Business filters use the (business_user, updated_at) and (business_user, rating) indexes, so the cost does not grow per review.
         """
         try:
-            offers_view = request.query_params.get('offers_view', 'false').lower() == 'true'
-            offer_id = request.query_params.get('offer', None)
-            business_user_id = request.query_params.get('business_user', None)
-            old_business_user_id = request.query_params.get('business_user_id', None)
-            reviewer_id = request.query_params.get('reviewer_id', None)
-
-            if request.user.type == 'business':
-                queryset = self.get_queryset().filter(offer__user=request.user)
-            else:
-                if offers_view and offer_id:
-                    queryset = self.get_queryset().filter(offer=offer_id)
-                elif offers_view and business_user_id:
-                    offer = Offer.objects.filter(user_id=business_user_id).first()
-                    if offer:
-                        queryset = self.get_queryset().filter(offer=offer.id)
-                    else:
-                        queryset = self.get_queryset().none()
-                elif old_business_user_id:
-                    offer = Offer.objects.filter(user_id=old_business_user_id).first()
-                    if offer:
-                        queryset = self.get_queryset().filter(offer=offer.id)
-                    else:
-                        queryset = self.get_queryset().none()
-                elif reviewer_id:
-                    queryset = self.get_queryset().filter(reviewer=reviewer_id)
-                else:
-                    queryset = self.get_queryset().filter(reviewer=request.user)
-
-            ordering = self.request.query_params.get('ordering', None)
-            if ordering:
-                if ordering == 'updated_at':
-                    queryset = queryset.order_by('updated_at')
-                elif ordering == '-updated_at':
-                    queryset = queryset.order_by('-updated_at')
-                elif ordering == 'rating':
-                    queryset = queryset.order_by('rating')
-                elif ordering == '-rating':
-                    queryset = queryset.order_by('-rating')
-                else:
-                    queryset = queryset.order_by('-updated_at')
-            else:
-                queryset = queryset.order_by('-updated_at')
+            queryset = self.order_list_queryset(self.filter_list_queryset(request))
+        except ValueError:
+            return Response({'error': 'Ungültiger Filterwert. Erwartet wird eine Zahl.'}, status=status.HTTP_400_BAD_REQUEST)
 
-            serializer = ReviewSerializer(queryset, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
-        except Exception as e:
-            return Response([], status=status.HTTP_200_OK)
+        if request.query_params.get('pagination') == 'cursor':
+            paginator = ReviewCursorPagination()
+            page = paginator.paginate_queryset(queryset, request, view=self)
+            serializer = ReviewSerializer(page, many=True)
+            return paginator.get_paginated_response(serializer.data)
+
+        serializer = ReviewSerializer(queryset, many=True)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+    def filter_list_queryset(self, request):
+        """
+        Applies the list filters of the request.
+        Raises ValueError for non-numeric ids.
+        """
+        offers_view = request.query_params.get('offers_view', 'false').lower() == 'true'
+        offer_id = request.query_params.get('offer', None)
+        business_user_id = request.query_params.get('business_user', None)
+        old_business_user_id = request.query_params.get('business_user_id', None)
+        reviewer_id = request.query_params.get('reviewer_id', None)
+        queryset = self.get_queryset()
+
+        if request.user.type == 'business':
+            return queryset.filter(business_user=request.user)
+        if offers_view and offer_id:
+            return queryset.filter(offer=int(offer_id))
+        if offers_view and business_user_id:
+            return queryset.filter(business_user_id=int(business_user_id))
+        if old_business_user_id:
+            return queryset.filter(business_user_id=int(old_business_user_id))
+        if reviewer_id:
+            return queryset.filter(reviewer=int(reviewer_id))
+        return queryset.filter(reviewer=request.user)
+
+    def order_list_queryset(self, queryset):
+        """
+        Orders the list by the 'ordering' query parameter, newest update first by default.
+        """
+        ordering = self.request.query_params.get('ordering', None)
+        return queryset.order_by(*ReviewCursorPagination.ordering_choices.get(ordering, ReviewCursorPagination.ordering))
 
     def get_serializer_class(self):
         """
@@ -151,6 +168,20 @@ class ReviewViewSet(viewsets.ModelViewSet):
         except Exception as e:
             return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
+    def perform_update(self, serializer):
+        """
+        Saves a review update together with its rating summary change.
+        """
+        with transaction.atomic():
+            serializer.save()
+
+    def perform_destroy(self, instance):
+        """
+        Deletes a review together with its rating summary change.
+        """
+        with transaction.atomic():
+            instance.delete()
+
     def perform_create(self, serializer):
         """
         Performs the actual creation of a review.
@@ -172,7 +203,8 @@ class ReviewViewSet(viewsets.ModelViewSet):
             raise PermissionDenied('Ein Benutzer kann nur eine Bewertung pro Geschäftsprofil abgeben.')
 
         print("Speichere Bewertung...")
-        serializer.save(reviewer=self.request.user)
+        with transaction.atomic():
+            serializer.save(reviewer=self.request.user)
         print("Bewertung erfolgreich gespeichert")
         print(f"=== END PERFORM CREATE ===")
 
@@ -203,7 +235,7 @@ class ReviewViewSet(viewsets.ModelViewSet):
         if 'business_user' in data and not data.get('offer'):
             business_user_id = data['business_user']
             try:
-                offer = Offer.objects.filter(user_id=business_user_id).first()
+                offer = first_offer_of(business_user_id)
                 if offer:
                     data['offer'] = offer.id
                     print(f"Angebot gefunden für Business User {business_user_id}: {offer.id}")
@@ -222,7 +254,8 @@ class ReviewViewSet(viewsets.ModelViewSet):
             serializer = self.get_serializer(data=data)
             serializer.is_valid(raise_exception=True)
             
-            review = serializer.save(reviewer=request.user)
+            with transaction.atomic():
+                review = serializer.save(reviewer=request.user)
             
             response_serializer = ReviewSerializer(review)
             return Response(response_serializer.data, status=status.HTTP_201_CREATED)
@@ -239,3 +272,24 @@ class ReviewViewSet(viewsets.ModelViewSet):
                     status=status.HTTP_403_FORBIDDEN
                 )
             return Response({'error': f'Fehler beim Erstellen der Bewertung: {str(e)}'}, status=status.HTTP_400_BAD_REQUEST)
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def rating_summary(request, business_user_id):
+    """
+    Returns the review count, average rating and rating histogram of a business user.
+    Reads the maintained summary instead of aggregating the reviews.
+    """
+    if not CustomUser.objects.filter(pk=business_user_id, type='business').exists():
+        return Response({'error': 'No CustomUser matches the given query.'}, status=status.HTTP_404_NOT_FOUND)
+    summary = (
+        BusinessRatingSummary.objects.filter(business_user_id=business_user_id).first()
+        or BusinessRatingSummary(business_user_id=business_user_id)
+    )
+    return Response({
+        'business_user': business_user_id,
+        'review_count': summary.review_count,
+        'average_rating': summary.average_rating,
+        'histogram': summary.histogram,
+    }, status=status.HTTP_200_OK)
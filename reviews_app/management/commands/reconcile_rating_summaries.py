@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+from reviews_app import summaries
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the rating summary of every business user from the reviews.'
+
+    def handle(self, *args, **options):
+        written = summaries.rebuild_summaries()
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {written} rating summaries.'))
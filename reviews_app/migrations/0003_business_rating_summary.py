@@ -0,0 +1,44 @@
+# Generated by Django 5.2.5 on 2026-10-18 02:35
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def fill_business_rating_summaries(apps, schema_editor):
+    Review = apps.get_model('reviews_app', 'Review')
+    BusinessRatingSummary = apps.get_model('reviews_app', 'BusinessRatingSummary')
+    summaries = {}
+    for row in Review.objects.order_by().values('offer__user', 'rating').annotate(total=Count('id')):
+        summary = summaries.setdefault(row['offer__user'], BusinessRatingSummary(business_user_id=row['offer__user']))
+        summary.review_count += row['total']
+        summary.rating_sum += row['rating'] * row['total']
+        setattr(summary, f"rating_{row['rating']}", getattr(summary, f"rating_{row['rating']}") + row['total'])
+    BusinessRatingSummary.objects.bulk_create(summaries.values())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth_app', '0001_initial'),
+        ('reviews_app', '0002_auto_20250825_0837'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BusinessRatingSummary',
+            fields=[
+                ('business_user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='rating_summary', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('review_count', models.PositiveIntegerField(default=0)),
+                ('rating_sum', models.PositiveIntegerField(default=0)),
+                ('rating_1', models.PositiveIntegerField(default=0)),
+                ('rating_2', models.PositiveIntegerField(default=0)),
+                ('rating_3', models.PositiveIntegerField(default=0)),
+                ('rating_4', models.PositiveIntegerField(default=0)),
+                ('rating_5', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(fill_business_rating_summaries, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.5 on 2026-10-18 02:45
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def fill_review_business_user(apps, schema_editor):
+    Review = apps.get_model('reviews_app', 'Review')
+    Offer = apps.get_model('offers_app', 'Offer')
+    Review.objects.update(
+        business_user=Subquery(Offer.objects.filter(pk=OuterRef('offer_id')).values('user_id')[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth_app', '0001_initial'),
+        ('offers_app', '0001_initial'),
+        ('reviews_app', '0003_business_rating_summary'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='review',
+            name='business_user',
+            field=models.ForeignKey(db_index=False, editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='reviews_received', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.RunPython(fill_review_business_user, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='review',
+            name='business_user',
+            field=models.ForeignKey(db_index=False, editable=False, on_delete=django.db.models.deletion.CASCADE, related_name='reviews_received', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['business_user', 'updated_at'], name='review_business_updated_idx'),
+        ),
+    ]
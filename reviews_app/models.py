@@ -6,6 +6,12 @@ from offers_app.models import Offer
 class Review(models.Model):
     offer = models.ForeignKey(Offer, on_delete=models.CASCADE, related_name='reviews')
     reviewer = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name='reviews_given')
+    business_user = models.ForeignKey(
+        CustomUser,
+        on_delete=models.CASCADE,
+        related_name='reviews_received',
+        db_index=False,
+        editable=False)
     rating = models.IntegerField(choices=[
         (1, '1 Stern'),
         (2, '2 Sterne'),
@@ -20,10 +26,54 @@ class Review(models.Model):
     class Meta:
         unique_together = ['offer', 'reviewer']
         ordering = ['-updated_at']
+        indexes = [
+            models.Index(fields=['business_user', 'updated_at'], name='review_business_updated_idx'),
+            models.Index(fields=['business_user', 'rating'], name='review_business_rating_idx'),
+        ]
 
     def __str__(self):
         return f"Review von {self.reviewer.username} für {self.offer.title} - {self.rating} Sterne"
 
+    def save(self, *args, **kwargs):
+        if self.business_user_id is None:
+            self.business_user_id = self.offer.user_id
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_rating = instance.__dict__.get('rating')
+        return instance
+
+
+class BusinessRatingSummary(models.Model):
+    """
+    Review count, rating sum and rating histogram of a business user.
+    Maintained together with every review change, so profiles never aggregate reviews.
+    """
+    business_user = models.OneToOneField(
+        CustomUser,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='rating_summary')
+    review_count = models.PositiveIntegerField(default=0)
+    rating_sum = models.PositiveIntegerField(default=0)
+    rating_1 = models.PositiveIntegerField(default=0)
+    rating_2 = models.PositiveIntegerField(default=0)
+    rating_3 = models.PositiveIntegerField(default=0)
+    rating_4 = models.PositiveIntegerField(default=0)
+    rating_5 = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.business_user_id}: {self.average_rating} ({self.review_count})"
+
+    @property
+    def average_rating(self):
+        if not self.review_count:
+            return 0.0
+        return round(self.rating_sum / self.review_count, 1)
+
     @property
-    def business_user(self):
-        return self.offer.user
+    def histogram(self):
+        return {rating: getattr(self, f'rating_{rating}') for rating in range(1, 6)}
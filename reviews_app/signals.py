@@ -0,0 +1,19 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import Review
+from . import summaries
+
+
+@receiver(post_save, sender=Review)
+def update_rating_summary_on_save(sender, instance, created, raw=False, **kwargs):
+    if not raw:
+        if created:
+            summaries.record_created(instance)
+        else:
+            summaries.record_rating_change(instance, getattr(instance, '_loaded_rating', instance.rating))
+    instance._loaded_rating = instance.rating
+
+
+@receiver(post_delete, sender=Review)
+def update_rating_summary_on_delete(sender, instance, **kwargs):
+    summaries.record_deleted(instance)
@@ -0,0 +1,82 @@
+from collections import defaultdict
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+from .models import BusinessRatingSummary, Review
+
+
+def _adjust_summary(business_user_id, deltas):
+    """
+    Applies {field: delta} to the summary of a business user with one atomic update.
+    """
+    deltas = {field: delta for field, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    summaries = BusinessRatingSummary.objects.filter(business_user_id=business_user_id)
+    if summaries.update(**{field: F(field) + delta for field, delta in deltas.items()}):
+        return
+    try:
+        with transaction.atomic():
+            BusinessRatingSummary.objects.create(
+                business_user_id=business_user_id,
+                **{field: max(delta, 0) for field, delta in deltas.items()}
+            )
+    except IntegrityError:
+        summaries.update(**{field: F(field) + delta for field, delta in deltas.items()})
+
+
+def record_created(review):
+    """
+    Adds a new review to its business user's summary.
+    """
+    _adjust_summary(review.business_user_id, {
+        'review_count': 1,
+        'rating_sum': review.rating,
+        f'rating_{review.rating}': 1,
+    })
+
+
+def record_rating_change(review, old_rating):
+    """
+    Moves a review from its old rating to its current one.
+    """
+    if old_rating == review.rating:
+        return
+    deltas = defaultdict(int)
+    deltas['rating_sum'] = review.rating - old_rating
+    deltas[f'rating_{old_rating}'] -= 1
+    deltas[f'rating_{review.rating}'] += 1
+    _adjust_summary(review.business_user_id, deltas)
+
+
+def record_deleted(review):
+    """
+    Removes a deleted review from its business user's summary.
+    """
+    _adjust_summary(review.business_user_id, {
+        'review_count': -1,
+        'rating_sum': -review.rating,
+        f'rating_{review.rating}': -1,
+    })
+
+
+def rebuild_summaries():
+    """
+    Recomputes all rating summaries from the reviews.
+    Returns the number of summaries written.
+    """
+    summaries = {}
+    rows = (
+        Review.objects.order_by()
+        .values('business_user', 'rating')
+        .annotate(total=Count('id'))
+    )
+    for row in rows:
+        summary = summaries.setdefault(row['business_user'], BusinessRatingSummary(business_user_id=row['business_user']))
+        summary.review_count += row['total']
+        summary.rating_sum += row['rating'] * row['total']
+        setattr(summary, f"rating_{row['rating']}", getattr(summary, f"rating_{row['rating']}") + row['total'])
+
+    with transaction.atomic():
+        BusinessRatingSummary.objects.all().delete()
+        BusinessRatingSummary.objects.bulk_create(summaries.values())
+    return len(summaries)
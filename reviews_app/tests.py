@@ -1,3 +1,43 @@
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from auth_app.models import CustomUser
+from offers_app.models import Offer
+from .models import Review
 
-# Create your tests here.
+
+class ReviewCursorPaginationTests(TestCase):
+    """
+    Ensures the keyset review feed visits every review once, however many share a rating.
+    """
+    review_count = 1031
+
+    def setUp(self):
+        self.business = CustomUser.objects.create_user(
+            username='business', email='business@example.com', password='password', type='business'
+        )
+        offer = Offer.objects.create(user=self.business, title='Offer', description='Description')
+        reviewers = CustomUser.objects.bulk_create([
+            CustomUser(username=f'customer{index}', email=f'customer{index}@example.com', type='customer')
+            for index in range(self.review_count)
+        ])
+        Review.objects.bulk_create([
+            Review(offer=offer, reviewer=reviewer, business_user=self.business, rating=5, description='Gut')
+            for reviewer in reviewers
+        ])
+        self.client = APIClient()
+        self.client.force_authenticate(self.business)
+
+    def test_pages_through_more_than_a_thousand_tied_ratings(self):
+        url = '/api/reviews/?pagination=cursor&ordering=-rating&page_size=6'
+        ids = []
+        while url:
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertFalse(any('OFFSET' in query['sql'] for query in context.captured_queries))
+            ids += [review['id'] for review in response.data['results']]
+            url = response.data['next']
+        self.assertEqual(len(ids), self.review_count)
+        self.assertEqual(ids, sorted(Review.objects.values_list('id', flat=True), reverse=True))